@@ -17,6 +17,7 @@ from gitlab.exceptions import (
     GitlabGetError,
     GitlabHttpError,
 )
+from requests.adapters import HTTPAdapter
 
 from gitlab_mcp.client.exceptions import (
     AuthenticationError,
@@ -39,6 +40,38 @@ ERR_FILE_PATH_REQUIRED = "file_path is required and cannot be empty"
 ERR_BRANCH_REQUIRED = "branch is required and cannot be empty"
 ERR_COMMIT_MSG_REQUIRED = "commit_message is required and cannot be empty"
 
+# Keep-alive connections kept per host. requests defaults to 10, which is fewer
+# than the server's concurrent tool workers, so extra connections were dropped
+# and each later call paid a fresh TCP/TLS handshake.
+HTTP_POOL_MAXSIZE = 32
+
+
+def _tail_job_log(raw: bytes, tail_lines: int | None) -> tuple[bytes, int, int]:
+    """
+    Count the lines of a raw job log and slice off its last tail_lines lines.
+
+    Works on the undecoded bytes and never splits the log into a list of
+    lines, so a multi-megabyte trace is only copied for the part returned.
+
+    Args:
+        raw: Raw job log
+        tail_lines: Number of trailing lines to keep, or None/<=0 for all
+
+    Returns:
+        Tuple of (log tail, total line count, returned line count)
+    """
+    total_lines = raw.count(b"\n")
+    if raw and not raw.endswith(b"\n"):
+        total_lines += 1
+    if tail_lines is None or tail_lines <= 0 or total_lines <= tail_lines:
+        return raw, total_lines, total_lines
+
+    # Walk back over tail_lines line breaks, not counting a trailing newline
+    start = len(raw) - 1 if raw.endswith(b"\n") else len(raw)
+    for _ in range(tail_lines):
+        start = raw.rfind(b"\n", 0, start)
+    return raw[start + 1 :], total_lines, tail_lines
+
 
 class GitLabClient:
     """
@@ -86,6 +119,10 @@ class GitLabClient:
                 private_token=self.config.gitlab_token.get_secret_value(),
                 timeout=self.config.timeout,
             )
+            # Reuse one keep-alive connection per concurrent worker
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_MAXSIZE)
+            self._gitlab.session.mount("https://", adapter)
+            self._gitlab.session.mount("http://", adapter)
 
             # Authenticate
             self._gitlab.auth()
@@ -4320,30 +4357,18 @@ class GitLabClient:
 
             # Get job trace (log)
             trace = job.trace()
-
-            # Decode bytes to string if needed
             if isinstance(trace, bytes):
-                trace_str = trace.decode("utf-8", errors="replace")
+                raw = trace
             else:
-                trace_str = str(trace) if trace else ""
-
-            # Calculate line counts
-            lines = trace_str.splitlines(keepends=True) if trace_str else []
-            total_lines = len(lines)
-
-            # Apply tail if requested
-            truncated = False
-            if tail_lines is not None and tail_lines > 0 and total_lines > tail_lines:
-                lines = lines[-tail_lines:]
-                trace_str = "".join(lines)
-                truncated = True
+                raw = str(trace).encode("utf-8") if trace else b""
 
-            returned_lines = len(lines)
+            # Count and tail on bytes, then decode only what is returned
+            tail, total_lines, returned_lines = _tail_job_log(raw, tail_lines)
 
             return {
                 "job_id": job_id,
-                "trace": trace_str,
-                "truncated": truncated,
+                "trace": tail.decode("utf-8", errors="replace"),
+                "truncated": returned_lines < total_lines,
                 "total_lines": total_lines,
                 "returned_lines": returned_lines,
             }
@@ -35,6 +35,8 @@ class GitLabConfig(BaseSettings):
         timeout: Request timeout in seconds (default: 30, range: 1-300)
         log_level: Logging level (default: INFO)
         verify_ssl: Verify SSL certificates (default: True)
+        cache_ttl: Seconds to cache read-only tool results (default: 30, 0 disables)
+        pretty_json: Indent JSON in tool and resource responses (default: False)
     """
 
     model_config = SettingsConfigDict(env_prefix="GITLAB_", case_sensitive=False, extra="ignore")
@@ -55,6 +57,17 @@ class GitLabConfig(BaseSettings):
 
     verify_ssl: bool = Field(default=True, description="Verify SSL certificates")
 
+    cache_ttl: int = Field(
+        default=30,
+        description="Seconds to cache read-only tool results (0 disables)",
+        ge=0,
+        le=3600,
+    )
+
+    pretty_json: bool = Field(
+        default=False, description="Indent JSON in tool and resource responses"
+    )
+
     @field_validator("gitlab_url")
     @classmethod
     def validate_url(cls, v: str) -> str:
@@ -115,7 +128,9 @@ class GitLabConfig(BaseSettings):
             f"gitlab_token='***', "
             f"timeout={self.timeout}, "
             f"log_level='{self.log_level}', "
-            f"verify_ssl={self.verify_ssl})"
+            f"verify_ssl={self.verify_ssl}, "
+            f"cache_ttl={self.cache_ttl}, "
+            f"pretty_json={self.pretty_json})"
         )
 
     def __str__(self) -> str:
@@ -174,14 +189,16 @@ def load_config(config_file: Path | None = None) -> GitLabConfig:
         "timeout": os.getenv("GITLAB_TIMEOUT"),
         "log_level": os.getenv("GITLAB_LOG_LEVEL"),
         "verify_ssl": os.getenv("GITLAB_VERIFY_SSL"),
+        "cache_ttl": os.getenv("GITLAB_CACHE_TTL"),
+        "pretty_json": os.getenv("GITLAB_PRETTY_JSON"),
     }
 
     for key, value in env_vars.items():
         if value is not None:
             # Convert string values to appropriate types
-            if key == "timeout":
+            if key in ("timeout", "cache_ttl"):
                 settings_kwargs[key] = int(value)
-            elif key == "verify_ssl":
+            elif key in ("verify_ssl", "pretty_json"):
                 settings_kwargs[key] = value.lower() in ("true", "1", "yes")
             else:
                 settings_kwargs[key] = value
@@ -9,29 +9,50 @@ Supports multiple transports:
 - http: Streamable HTTP for remote clients like IBM ContextForge
 """
 
-import argparse
 import asyncio
+import functools
+import inspect
+import json
 import logging
 import sys
-from collections.abc import Callable
-from typing import Any, Literal
-
+from collections.abc import Awaitable, Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
+
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
+from mcp.types import (
+    GetPromptResult,
+    Prompt,
+    PromptArgument,
+    PromptMessage,
+    Resource,
+    ResourceTemplate,
+    TextContent,
+    TextResourceContents,
+    Tool,
+)
+from pydantic import AnyUrl
 
 from gitlab_mcp import tools
-from gitlab_mcp.client.gitlab_client import GitLabClient
+from gitlab_mcp.client.gitlab_client import HTTP_POOL_MAXSIZE, GitLabClient
 from gitlab_mcp.config.settings import GitLabConfig, load_config
 from gitlab_mcp.prompts.registry import PromptRegistry
 from gitlab_mcp.resources.handlers import read_resource as read_resource_handler
 from gitlab_mcp.resources.registry import ResourceRegistry
+from gitlab_mcp.utils.cache import ToolResultCache
+
+if TYPE_CHECKING:
+    import argparse
 
 
 # Helper functions to reduce cognitive complexity in async_main (SonarQube S3776)
 def _build_resources_list(registry: ResourceRegistry) -> list[Any]:
     """Build list of MCP Resource objects from registry."""
-    from mcp.types import Resource
-
     return [
         Resource(
             uri=res["uri"],
@@ -45,8 +66,6 @@ def _build_resources_list(registry: ResourceRegistry) -> list[Any]:
 
 def _build_resource_templates_list(registry: ResourceRegistry) -> list[Any]:
     """Build list of MCP ResourceTemplate objects from registry."""
-    from mcp.types import ResourceTemplate
-
     return [
         ResourceTemplate(
             uriTemplate=tmpl["uri_template"],
@@ -58,43 +77,59 @@ def _build_resource_templates_list(registry: ResourceRegistry) -> list[Any]:
     ]
 
 
+def _build_prompt_arguments(raw_args: list[dict[str, Any]] | None) -> list[Any] | None:
+    """Build MCP PromptArgument objects, or None when the prompt takes no arguments."""
+    if not raw_args:
+        return None
+
+    return [
+        PromptArgument(
+            name=arg["name"],
+            description=arg.get("description"),
+            required=arg.get("required", False),
+        )
+        for arg in raw_args
+    ]
+
+
 def _build_prompts_list(registry: PromptRegistry) -> list[Any]:
     """Build list of MCP Prompt objects from registry."""
-    from mcp.types import Prompt, PromptArgument
-
-    prompts = []
-    for prompt_def in registry.list_prompts():
-        arguments = [
-            PromptArgument(
-                name=arg["name"],
-                description=arg.get("description"),
-                required=arg.get("required", False),
-            )
-            for arg in prompt_def.get("arguments", [])
-        ]
-        prompts.append(
-            Prompt(
-                name=prompt_def["name"],
-                description=prompt_def.get("description"),
-                arguments=arguments if arguments else None,
-            )
+    return [
+        Prompt(
+            name=prompt_def["name"],
+            description=prompt_def.get("description"),
+            arguments=_build_prompt_arguments(prompt_def.get("arguments")),
         )
-    return prompts
+        for prompt_def in registry.list_prompts()
+    ]
 
 
 def _build_prompt_messages(registry: PromptRegistry, name: str, arguments: dict[str, str]) -> Any:
     """Build GetPromptResult from registry prompt messages."""
-    from mcp.types import GetPromptResult, PromptMessage, TextContent
+    return GetPromptResult(
+        messages=[
+            PromptMessage(
+                role=msg["role"],
+                content=TextContent(type="text", text=msg["content"]),
+            )
+            for msg in registry.get_prompt_messages(name, arguments)
+        ]
+    )
 
-    messages = registry.get_prompt_messages(name, arguments)
-    prompt_messages = [
-        PromptMessage(
-            role=msg["role"],
-            content=TextContent(type="text", text=msg["content"]),
-        )
-        for msg in messages
-    ]
-    return GetPromptResult(messages=prompt_messages)
+
+async def _run_stdio_server(mcp_server: Server, host: str, port: int) -> None:
+    """
+    Run the MCP server with standard I/O transport.
+
+    This serves local CLI clients like Claude Code over stdin/stdout.
+
+    Args:
+        mcp_server: The configured MCP Server instance
+        host: Unused; accepted so all transports share one signature
+        port: Unused; accepted so all transports share one signature
+    """
+    async with stdio_server() as (read_stream, write_stream):
+        await mcp_server.run(read_stream, write_stream, mcp_server.create_initialization_options())
 
 
 async def _run_http_server(mcp_server: Server, host: str, port: int) -> None:
@@ -128,6 +163,8 @@ async def _run_http_server(mcp_server: Server, host: str, port: int) -> None:
     class StreamableHTTPASGIApp:
         """ASGI application for Streamable HTTP server transport."""
 
+        __slots__ = ("session_manager",)
+
         def __init__(self, manager: StreamableHTTPSessionManager) -> None:
             self.session_manager = manager
 
@@ -163,6 +200,13 @@ async def _run_http_server(mcp_server: Server, host: str, port: int) -> None:
     await server.serve()
 
 
+# Transport runners keyed by the --transport choice
+_TRANSPORTS: dict[str, Callable[[Server, str, int], Awaitable[None]]] = {
+    "stdio": _run_stdio_server,
+    "http": _run_http_server,
+}
+
+
 # Schema description constants (SonarQube S1192 compliance)
 DESC_PROJECT_ID = "Project ID or path (e.g., 'group/project')"
 DESC_PAGE = "Page number (optional, default: 1)"
@@ -182,121 +226,316 @@ DESC_AUTHOR_EMAIL = "Email of commit author (optional)"
 DESC_AUTHOR_NAME = "Name of commit author (optional)"
 DESC_SOURCE_REF = "Source branch, tag, or commit SHA"
 
+# Parameter specs shared by many tool schemas. These are module-level
+# singletons, so schema builders must copy them rather than mutate them.
+_PARAM_PROJECT_ID: dict[str, Any] = {"type": "string", "description": DESC_PROJECT_ID}
+_PARAM_PAGE: dict[str, Any] = {"type": "integer", "description": DESC_PAGE}
+_PARAM_PER_PAGE: dict[str, Any] = {"type": "integer", "description": DESC_PER_PAGE}
+_PARAM_MR_IID: dict[str, Any] = {"type": "integer", "description": DESC_MR_IID}
+_PARAM_ISSUE_IID: dict[str, Any] = {"type": "integer", "description": DESC_ISSUE_IID}
+_PARAM_PIPELINE_ID: dict[str, Any] = {"type": "integer", "description": DESC_PIPELINE_ID}
+_PARAM_JOB_ID: dict[str, Any] = {"type": "integer", "description": DESC_JOB_ID}
+_PARAM_NEW_TITLE: dict[str, Any] = {"type": "string", "description": DESC_NEW_TITLE}
+_PARAM_NEW_DESC: dict[str, Any] = {"type": "string", "description": DESC_NEW_DESC}
+_PARAM_WIKI_SLUG: dict[str, Any] = {"type": "string", "description": DESC_WIKI_SLUG}
+_PARAM_SNIPPET_ID: dict[str, Any] = {"type": "integer", "description": DESC_SNIPPET_ID}
+_PARAM_TAG_NAME: dict[str, Any] = {"type": "string", "description": DESC_TAG_NAME}
+_PARAM_AUTHOR_EMAIL: dict[str, Any] = {"type": "string", "description": DESC_AUTHOR_EMAIL}
+_PARAM_AUTHOR_NAME: dict[str, Any] = {"type": "string", "description": DESC_AUTHOR_NAME}
+
 # Module logger for security-safe error logging
 logger = logging.getLogger(__name__)
 
+# Tool functions wrap blocking python-gitlab calls, so MCP tool calls run on
+# this bounded pool to let concurrent requests overlap their network waits.
+# It is sized to the client's connection pool so every worker keeps a connection.
+_TOOL_EXECUTOR = ThreadPoolExecutor(
+    max_workers=HTTP_POOL_MAXSIZE, thread_name_prefix="gitlab-mcp-tool"
+)
+
+
+def _select_json_dumps(pretty: bool = False) -> Callable[[Any], str]:
+    """
+    Select the JSON encoder for tool and resource responses.
+
+    Responses are compact by default since clients parse or tokenize them;
+    indentation only adds bytes. orjson is an optional speedup
+    (``pip install python-gitlab-mcp[orjson]``) for large list and job trace
+    payloads. Without it, or for values orjson rejects (e.g. non-string dict
+    keys), a stdlib JSONEncoder created once here is used; like orjson it
+    emits non-ASCII text as-is rather than as \\u escapes.
+
+    Args:
+        pretty: Indent output by two spaces (GITLAB_PRETTY_JSON)
+
+    Returns:
+        Function that serializes a value to a JSON string
+    """
+    # json.dumps() builds a new JSONEncoder per call whenever options are passed
+    stdlib_dumps = (
+        json.JSONEncoder(ensure_ascii=False, indent=2)
+        if pretty
+        else json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    ).encode
+    try:
+        import orjson
+    except ImportError:
+        return stdlib_dumps
+
+    option = orjson.OPT_INDENT_2 if pretty else None
+
+    def dumps(value: Any) -> str:
+        try:
+            return orjson.dumps(value, option=option).decode()
+        except TypeError:
+            return stdlib_dumps(value)
+
+    return dumps
+
+
+class _ToolArgumentError(TypeError):
+    """Raised when a tool's arguments cannot be bound to its parameters."""
+
+
+def _run_tool_in_thread(
+    tool_func: Callable[..., Any], client: GitLabClient, arguments: dict[str, Any]
+) -> Any:
+    """Run a tool coroutine to completion on a private event loop in a worker thread."""
+    try:
+        # Calling an async tool only binds its arguments; the body runs in asyncio.run
+        coro = tool_func(client, **arguments)
+    except TypeError as e:
+        raise _ToolArgumentError(str(e)) from e
+    return asyncio.run(coro)
+
+
+async def _dispatch_tool(
+    tool_func: Callable[..., Any],
+    client: GitLabClient,
+    name: str,
+    param_names: tuple[str, ...],
+    arguments: dict[str, Any],
+    cache: ToolResultCache | None,
+) -> Any:
+    """
+    Run a tool on the worker pool, serving recent read-only results from the cache.
+
+    Concurrent calls with the same cache key share the in-flight call instead
+    of each querying GitLab.
+
+    Args:
+        tool_func: Tool function to run
+        client: GitLab client passed to the tool
+        name: Tool name
+        param_names: The tool's parameter names, used to build cache keys
+        arguments: Tool arguments
+        cache: Result cache, or None when caching is disabled
+
+    Returns:
+        Tool result
+    """
+    # A call through execute_tool is cached and invalidates like the tool it runs
+    tool_name, tool_arguments = name, arguments
+    if name == "execute_tool":
+        tool_name = arguments.get("tool_name", "")
+        tool_arguments = arguments.get("arguments") or {}
+        param_names = _TOOL_PARAM_NAMES.get(tool_name, ())
+
+    cache_key = None
+    generation = 0
+    if cache is not None and tool_name in _CACHEABLE_TOOLS:
+        cache_key = cache.make_key(tool_name, param_names, tool_arguments)
+        if cache_key is not None:
+            generation = cache.generation
+            hit, cached = cache.get(cache_key)
+            if hit:
+                return cached
+            pending = cache.inflight.get(cache_key)
+            if pending is not None:
+                return await asyncio.shield(pending)
+
+    future = asyncio.get_running_loop().run_in_executor(
+        _TOOL_EXECUTOR, _run_tool_in_thread, tool_func, client, arguments
+    )
+    if cache is not None and cache_key is not None:
+        cache.inflight[cache_key] = future
+        try:
+            # Shield so a cancelled caller does not cancel the calls sharing it
+            result = await asyncio.shield(future)
+        finally:
+            # An invalidation may have replaced this entry with a newer call
+            if cache.inflight.get(cache_key) is future:
+                del cache.inflight[cache_key]
+        # execute_tool reports a failed tool as an error result rather than raising
+        if name != "execute_tool" or not (isinstance(result, dict) and "error" in result):
+            # Skipped if a mutation invalidated the cache while this call ran
+            cache.set(cache_key, result, generation)
+        return result
+
+    if cache is not None and not get_tool_annotations(tool_name)["readOnly"]:
+        # Invalidate once the worker finishes, even if the write failed or the
+        # caller was cancelled, so reads during the write are not cached
+        future.add_done_callback(lambda _: cache.invalidate())
+    # Shield so a cancelled caller leaves the future to finish with the worker
+    return await asyncio.shield(future)
+
+
 # Tool annotations for MCP SDK v1.25.0 (SEP-986)
-# Maps tool names to behavior hints for client safety prompts
-TOOL_ANNOTATIONS: dict[str, dict[str, bool]] = {
-    # Context tools - read-only
-    "get_current_context": {"destructive": False, "readOnly": True},
-    # Repository tools - read-only
-    "list_repository_tree": {"destructive": False, "readOnly": True},
-    "get_file_contents": {"destructive": False, "readOnly": True},
-    "search_code": {"destructive": False, "readOnly": True},
-    "list_branches": {"destructive": False, "readOnly": True},
-    "get_branch": {"destructive": False, "readOnly": True},
-    "list_commits": {"destructive": False, "readOnly": True},
-    "get_commit": {"destructive": False, "readOnly": True},
-    "compare_branches": {"destructive": False, "readOnly": True},
-    "list_tags": {"destructive": False, "readOnly": True},
-    "get_tag": {"destructive": False, "readOnly": True},
-    # Repository tools - mutating
-    "create_file": {"destructive": False, "readOnly": False},
-    "update_file": {"destructive": False, "readOnly": False},
-    "delete_file": {"destructive": True, "readOnly": False},
-    "create_branch": {"destructive": False, "readOnly": False},
-    "delete_branch": {"destructive": True, "readOnly": False},
-    "create_tag": {"destructive": False, "readOnly": False},
-    # Issue tools - read-only
-    "list_issues": {"destructive": False, "readOnly": True},
-    "get_issue": {"destructive": False, "readOnly": True},
-    "list_issue_comments": {"destructive": False, "readOnly": True},
-    # Issue tools - mutating
-    "create_issue": {"destructive": False, "readOnly": False},
-    "update_issue": {"destructive": False, "readOnly": False},
-    "close_issue": {"destructive": False, "readOnly": False},
-    "reopen_issue": {"destructive": False, "readOnly": False},
-    "add_issue_comment": {"destructive": False, "readOnly": False},
-    # Merge Request tools - read-only
-    "list_merge_requests": {"destructive": False, "readOnly": True},
-    "get_merge_request": {"destructive": False, "readOnly": True},
-    "get_merge_request_changes": {"destructive": False, "readOnly": True},
-    "get_merge_request_commits": {"destructive": False, "readOnly": True},
-    "get_merge_request_pipelines": {"destructive": False, "readOnly": True},
-    "list_mr_comments": {"destructive": False, "readOnly": True},
-    # Merge Request tools - mutating
-    "create_merge_request": {"destructive": False, "readOnly": False},
-    "update_merge_request": {"destructive": False, "readOnly": False},
-    "close_merge_request": {"destructive": False, "readOnly": False},
-    "reopen_merge_request": {"destructive": False, "readOnly": False},
-    "merge_merge_request": {"destructive": False, "readOnly": False},
-    "approve_merge_request": {"destructive": False, "readOnly": False},
-    "unapprove_merge_request": {"destructive": False, "readOnly": False},
-    "add_mr_comment": {"destructive": False, "readOnly": False},
-    # Pipeline tools - read-only
-    "list_pipelines": {"destructive": False, "readOnly": True},
-    "get_pipeline": {"destructive": False, "readOnly": True},
-    "list_pipeline_jobs": {"destructive": False, "readOnly": True},
-    "get_job": {"destructive": False, "readOnly": True},
-    "get_job_trace": {"destructive": False, "readOnly": True},
-    "list_pipeline_variables": {"destructive": False, "readOnly": True},
-    # Pipeline tools - mutating
-    "create_pipeline": {"destructive": False, "readOnly": False},
-    "retry_pipeline": {"destructive": False, "readOnly": False},
-    "cancel_pipeline": {"destructive": True, "readOnly": False},
-    "delete_pipeline": {"destructive": True, "readOnly": False},
-    "retry_job": {"destructive": False, "readOnly": False},
-    "cancel_job": {"destructive": True, "readOnly": False},
-    "play_job": {"destructive": False, "readOnly": False},
-    "download_job_artifacts": {"destructive": False, "readOnly": False},
-    # Project tools - read-only
-    "list_projects": {"destructive": False, "readOnly": True},
-    "get_project": {"destructive": False, "readOnly": True},
-    "search_projects": {"destructive": False, "readOnly": True},
-    "list_project_members": {"destructive": False, "readOnly": True},
-    "get_project_statistics": {"destructive": False, "readOnly": True},
-    "list_milestones": {"destructive": False, "readOnly": True},
-    "get_milestone": {"destructive": False, "readOnly": True},
-    # Project tools - mutating
-    "create_project": {"destructive": False, "readOnly": False},
-    "create_milestone": {"destructive": False, "readOnly": False},
-    "update_milestone": {"destructive": False, "readOnly": False},
-    # Label tools - read-only
-    "list_labels": {"destructive": False, "readOnly": True},
-    # Label tools - mutating
-    "create_label": {"destructive": False, "readOnly": False},
-    "update_label": {"destructive": False, "readOnly": False},
-    "delete_label": {"destructive": True, "readOnly": False},
-    # Wiki tools - read-only
-    "list_wiki_pages": {"destructive": False, "readOnly": True},
-    "get_wiki_page": {"destructive": False, "readOnly": True},
-    # Wiki tools - mutating
-    "create_wiki_page": {"destructive": False, "readOnly": False},
-    "update_wiki_page": {"destructive": False, "readOnly": False},
-    "delete_wiki_page": {"destructive": True, "readOnly": False},
-    # Snippet tools - read-only
-    "list_snippets": {"destructive": False, "readOnly": True},
-    "get_snippet": {"destructive": False, "readOnly": True},
-    # Snippet tools - mutating
-    "create_snippet": {"destructive": False, "readOnly": False},
-    "update_snippet": {"destructive": False, "readOnly": False},
-    "delete_snippet": {"destructive": True, "readOnly": False},
-    # Release tools - read-only
-    "list_releases": {"destructive": False, "readOnly": True},
-    "get_release": {"destructive": False, "readOnly": True},
-    # Release tools - mutating
-    "create_release": {"destructive": False, "readOnly": False},
-    "update_release": {"destructive": False, "readOnly": False},
-    "delete_release": {"destructive": True, "readOnly": False},
-    # User tools - read-only
-    "get_user": {"destructive": False, "readOnly": True},
-    "search_users": {"destructive": False, "readOnly": True},
-    "list_user_projects": {"destructive": False, "readOnly": True},
-    # Group tools - read-only
-    "list_groups": {"destructive": False, "readOnly": True},
-    "get_group": {"destructive": False, "readOnly": True},
-    "list_group_members": {"destructive": False, "readOnly": True},
+# Maps tool names to behavior hints for client safety prompts.
+# Tools are grouped by behavior and every tool in a group shares one annotation,
+# so the annotations are read-only views that callers cannot change for the group.
+_READ_ONLY_ANNOTATION: Mapping[str, bool] = MappingProxyType(
+    {"destructive": False, "readOnly": True}
+)
+_MUTATING_ANNOTATION: Mapping[str, bool] = MappingProxyType(
+    {"destructive": False, "readOnly": False}
+)
+_DESTRUCTIVE_ANNOTATION: Mapping[str, bool] = MappingProxyType(
+    {"destructive": True, "readOnly": False}
+)
+
+_READ_ONLY_TOOLS = (
+    # Context
+    "get_current_context",
+    # Repositories
+    "list_repository_tree",
+    "get_file_contents",
+    "search_code",
+    "list_branches",
+    "get_branch",
+    "list_commits",
+    "get_commit",
+    "compare_branches",
+    "list_tags",
+    "get_tag",
+    # Issues
+    "list_issues",
+    "get_issue",
+    "list_issue_comments",
+    # Merge Requests
+    "list_merge_requests",
+    "get_merge_request",
+    "get_merge_request_changes",
+    "get_merge_request_commits",
+    "get_merge_request_pipelines",
+    "list_mr_comments",
+    # Pipelines
+    "list_pipelines",
+    "get_pipeline",
+    "list_pipeline_jobs",
+    "get_job",
+    "get_job_trace",
+    "list_pipeline_variables",
+    # Projects
+    "list_projects",
+    "get_project",
+    "search_projects",
+    "list_project_members",
+    "get_project_statistics",
+    "list_milestones",
+    "get_milestone",
+    # Labels
+    "list_labels",
+    # Wikis
+    "list_wiki_pages",
+    "get_wiki_page",
+    # Snippets
+    "list_snippets",
+    "get_snippet",
+    # Releases
+    "list_releases",
+    "get_release",
+    # Users
+    "get_user",
+    "search_users",
+    "list_user_projects",
+    # Groups
+    "list_groups",
+    "get_group",
+    "list_group_members",
+)
+
+_MUTATING_TOOLS = (
+    # Repositories
+    "create_file",
+    "update_file",
+    "create_branch",
+    "create_tag",
+    # Issues
+    "create_issue",
+    "update_issue",
+    "close_issue",
+    "reopen_issue",
+    "add_issue_comment",
+    # Merge Requests
+    "create_merge_request",
+    "update_merge_request",
+    "close_merge_request",
+    "reopen_merge_request",
+    "merge_merge_request",
+    "approve_merge_request",
+    "unapprove_merge_request",
+    "add_mr_comment",
+    # Pipelines
+    "create_pipeline",
+    "retry_pipeline",
+    "retry_job",
+    "play_job",
+    "download_job_artifacts",
+    # Projects
+    "create_project",
+    "create_milestone",
+    "update_milestone",
+    # Labels
+    "create_label",
+    "update_label",
+    # Wikis
+    "create_wiki_page",
+    "update_wiki_page",
+    # Snippets
+    "create_snippet",
+    "update_snippet",
+    # Releases
+    "create_release",
+    "update_release",
+)
+
+_DESTRUCTIVE_TOOLS = (
+    "delete_file",
+    "delete_branch",
+    "cancel_pipeline",
+    "delete_pipeline",
+    "cancel_job",
+    "delete_label",
+    "delete_wiki_page",
+    "delete_snippet",
+    "delete_release",
+)
+
+# Read-only tools whose results may be cached briefly. Tools that report
+# pipeline, job or merge status are left out because clients poll them to
+# follow progress; get_merge_request carries merge and head pipeline status.
+_CACHEABLE_TOOLS = frozenset(_READ_ONLY_TOOLS) - {
+    "list_pipelines",
+    "get_pipeline",
+    "list_pipeline_jobs",
+    "get_job",
+    "get_job_trace",
+    "get_merge_request",
+    "get_merge_request_pipelines",
+}
+
+TOOL_ANNOTATIONS: dict[str, Mapping[str, bool]] = {
+    **dict.fromkeys(_READ_ONLY_TOOLS, _READ_ONLY_ANNOTATION),
+    **dict.fromkeys(_MUTATING_TOOLS, _MUTATING_ANNOTATION),
+    **dict.fromkeys(_DESTRUCTIVE_TOOLS, _DESTRUCTIVE_ANNOTATION),
+}
+
+# Slim-mode meta-tools. Discovery only reads the static tool catalog;
+# execute_tool has no annotation because its behavior is that of the tool it runs.
+_META_TOOL_ANNOTATIONS: dict[str, Mapping[str, bool]] = {
+    "discover_tools": _READ_ONLY_ANNOTATION,
+    "get_tool_schema": _READ_ONLY_ANNOTATION,
 }
 
 # Tool icons for visual metadata in MCP SDK v1.25.0
@@ -365,7 +604,8 @@ def get_tool_icon(tool_name: str) -> str | None:
         "mr",
     ]
 
-    tool_lower = tool_name.lower()
+    # Registered tool names are lowercase, so skip the copy in the common case
+    tool_lower = tool_name if tool_name.islower() else tool_name.lower()
     for category in category_priority:
         if category in tool_lower:
             return TOOL_ICONS.get(category)
@@ -373,7 +613,7 @@ def get_tool_icon(tool_name: str) -> str | None:
     return None
 
 
-def get_tool_annotations(tool_name: str) -> dict[str, bool]:
+def get_tool_annotations(tool_name: str) -> Mapping[str, bool]:
     """
     Get annotations for a tool.
 
@@ -381,10 +621,37 @@ def get_tool_annotations(tool_name: str) -> dict[str, bool]:
         tool_name: Name of the tool
 
     Returns:
-        Dictionary with 'destructive' and 'readOnly' boolean fields.
+        Read-only mapping with 'destructive' and 'readOnly' boolean fields.
         Returns default (non-destructive, non-readonly) for unknown tools.
     """
-    return TOOL_ANNOTATIONS.get(tool_name, {"destructive": False, "readOnly": False})
+    annotation = TOOL_ANNOTATIONS.get(tool_name)
+    if annotation is None:
+        annotation = _META_TOOL_ANNOTATIONS.get(tool_name, _MUTATING_ANNOTATION)
+    return annotation
+
+
+@dataclass(slots=True, frozen=True)
+class ToolEntry:
+    """A tool registered on GitLabMCPServer.
+
+    Attributes:
+        name: Tool name
+        description: Tool description
+        function: Tool function to execute
+        is_async: Whether function is a coroutine function, checked once at registration
+    """
+
+    name: str
+    description: str
+    function: Callable[..., Any]
+    is_async: bool
+
+
+# Static part of GitLabMCPServer.get_info(), shared by every instance
+_SERVER_DESCRIPTION = "GitLab MCP Server - Model Context Protocol server for GitLab"
+_SERVER_INFO: Mapping[str, str] = MappingProxyType(
+    {"version": "0.1.0", "description": _SERVER_DESCRIPTION}
+)
 
 
 class GitLabMCPServer:
@@ -399,6 +666,8 @@ class GitLabMCPServer:
         name: Server name (default: "gitlab-mcp-server")
     """
 
+    __slots__ = ("config", "name", "gitlab_client", "_tools", "_tool_list")
+
     def __init__(self, config: GitLabConfig, name: str = "gitlab-mcp-server") -> None:
         """
         Initialize the GitLab MCP Server.
@@ -410,7 +679,9 @@ class GitLabMCPServer:
         self.config = config
         self.name = name
         self.gitlab_client = GitLabClient(config)
-        self._tools: dict[str, dict[str, Any]] = {}
+        self._tools: dict[str, ToolEntry] = {}
+        # Cached list_tools response, rebuilt after the next registration
+        self._tool_list: list[dict[str, Any]] | None = None
 
     def register_all_tools(self) -> None:
         """
@@ -430,483 +701,29 @@ class GitLabMCPServer:
         - User tools (3)
         - Group tools (3)
         """
-        # Context tools
-        self.register_tool(
-            "get_current_context",
-            "Get current GitLab user and server context information",
-            lambda **kwargs: tools.get_current_context(self.gitlab_client, **kwargs),
-        )
-
-        # Repository tools
-        self.register_tool(
-            "list_repository_tree",
-            "List files and directories in a repository tree",
-            lambda **kwargs: tools.list_repository_tree(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "get_file_contents",
-            "Get the contents of a file from a repository",
-            lambda **kwargs: tools.get_file_contents(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "search_code",
-            "Search for code in project repositories",
-            lambda **kwargs: tools.search_code(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "create_file",
-            "Create a new file in a repository with commit",
-            lambda **kwargs: tools.create_file(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "update_file",
-            "Update existing file content with commit",
-            lambda **kwargs: tools.update_file(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "delete_file",
-            "Delete a file from repository with commit",
-            lambda **kwargs: tools.delete_file(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "list_branches",
-            "List all branches in a repository",
-            lambda **kwargs: tools.list_branches(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "get_branch",
-            "Get details of a specific branch",
-            lambda **kwargs: tools.get_branch(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "create_branch",
-            "Create a new branch",
-            lambda **kwargs: tools.create_branch(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "delete_branch",
-            "Delete a branch",
-            lambda **kwargs: tools.delete_branch(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "get_commit",
-            "Get details of a specific commit",
-            lambda **kwargs: tools.get_commit(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "list_commits",
-            "List commits for a project or branch",
-            lambda **kwargs: tools.list_commits(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "compare_branches",
-            "Compare two branches, tags, or commits",
-            lambda **kwargs: tools.compare_branches(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "list_tags",
-            "List repository tags",
-            lambda **kwargs: tools.list_tags(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "get_tag",
-            "Get details of a specific tag",
-            lambda **kwargs: tools.get_tag(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "create_tag",
-            "Create a new tag",
-            lambda **kwargs: tools.create_tag(self.gitlab_client, **kwargs),
-        )
-
-        # Issue tools
-        self.register_tool(
-            "list_issues",
-            "List issues for a project",
-            lambda **kwargs: tools.list_issues(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "get_issue",
-            "Get details of a specific issue",
-            lambda **kwargs: tools.get_issue(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "create_issue",
-            "Create a new issue in a project",
-            lambda **kwargs: tools.create_issue(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "update_issue",
-            "Update an existing issue",
-            lambda **kwargs: tools.update_issue(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "close_issue",
-            "Close an issue",
-            lambda **kwargs: tools.close_issue(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "reopen_issue",
-            "Reopen a closed issue",
-            lambda **kwargs: tools.reopen_issue(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "add_issue_comment",
-            "Add a comment to an issue",
-            lambda **kwargs: tools.add_issue_comment(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "list_issue_comments",
-            "List all comments on an issue",
-            lambda **kwargs: tools.list_issue_comments(self.gitlab_client, **kwargs),
-        )
-
-        # Merge Request tools
-        self.register_tool(
-            "list_merge_requests",
-            "List merge requests for a project",
-            lambda **kwargs: tools.list_merge_requests(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "get_merge_request",
-            "Get details of a specific merge request",
-            lambda **kwargs: tools.get_merge_request(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "create_merge_request",
-            "Create a new merge request",
-            lambda **kwargs: tools.create_merge_request(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "update_merge_request",
-            "Update an existing merge request",
-            lambda **kwargs: tools.update_merge_request(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "merge_merge_request",
-            "Merge an approved merge request",
-            lambda **kwargs: tools.merge_merge_request(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "close_merge_request",
-            "Close a merge request without merging",
-            lambda **kwargs: tools.close_merge_request(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "reopen_merge_request",
-            "Reopen a closed merge request",
-            lambda **kwargs: tools.reopen_merge_request(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "approve_merge_request",
-            "Approve a merge request",
-            lambda **kwargs: tools.approve_merge_request(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "unapprove_merge_request",
-            "Remove approval from a merge request",
-            lambda **kwargs: tools.unapprove_merge_request(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "get_merge_request_changes",
-            "Get the file changes in a merge request",
-            lambda **kwargs: tools.get_merge_request_changes(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "get_merge_request_commits",
-            "Get commits in a merge request",
-            lambda **kwargs: tools.get_merge_request_commits(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "get_merge_request_pipelines",
-            "Get pipelines for a merge request",
-            lambda **kwargs: tools.get_merge_request_pipelines(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "add_mr_comment",
-            "Add a comment to a merge request",
-            lambda **kwargs: tools.add_mr_comment(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "list_mr_comments",
-            "List all comments on a merge request",
-            lambda **kwargs: tools.list_mr_comments(self.gitlab_client, **kwargs),
-        )
-
-        # Pipeline tools
-        self.register_tool(
-            "list_pipelines",
-            "List pipelines for a project",
-            lambda **kwargs: tools.list_pipelines(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "get_pipeline",
-            "Get details of a specific pipeline",
-            lambda **kwargs: tools.get_pipeline(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "create_pipeline",
-            "Create a new pipeline",
-            lambda **kwargs: tools.create_pipeline(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "retry_pipeline",
-            "Retry a failed pipeline",
-            lambda **kwargs: tools.retry_pipeline(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "cancel_pipeline",
-            "Cancel a running pipeline",
-            lambda **kwargs: tools.cancel_pipeline(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "delete_pipeline",
-            "Delete a pipeline",
-            lambda **kwargs: tools.delete_pipeline(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "list_pipeline_jobs",
-            "List jobs in a pipeline",
-            lambda **kwargs: tools.list_pipeline_jobs(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "get_job",
-            "Get details of a specific job",
-            lambda **kwargs: tools.get_job(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "get_job_trace",
-            "Get the trace log of a job",
-            lambda **kwargs: tools.get_job_trace(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "retry_job",
-            "Retry a failed job",
-            lambda **kwargs: tools.retry_job(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "cancel_job",
-            "Cancel a running job",
-            lambda **kwargs: tools.cancel_job(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "play_job",
-            "Play a manual job",
-            lambda **kwargs: tools.play_job(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "download_job_artifacts",
-            "Download artifacts from a job",
-            lambda **kwargs: tools.download_job_artifacts(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "list_pipeline_variables",
-            "List variables for a pipeline",
-            lambda **kwargs: tools.list_pipeline_variables(self.gitlab_client, **kwargs),
-        )
-
-        # Project tools
-        self.register_tool(
-            "list_projects",
-            "List projects accessible by the user",
-            lambda **kwargs: tools.list_projects(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "get_project",
-            "Get details of a specific project",
-            lambda **kwargs: tools.get_project(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "create_project",
-            "Create a new project in GitLab",
-            lambda **kwargs: tools.create_project(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "search_projects",
-            "Search for projects by name or description",
-            lambda **kwargs: tools.search_projects(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "list_project_members",
-            "List members of a project",
-            lambda **kwargs: tools.list_project_members(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "get_project_statistics",
-            "Get statistics for a project",
-            lambda **kwargs: tools.get_project_statistics(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "list_milestones",
-            "List milestones for a project",
-            lambda **kwargs: tools.list_milestones(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "get_milestone",
-            "Get details of a specific milestone",
-            lambda **kwargs: tools.get_milestone(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "create_milestone",
-            "Create a new milestone",
-            lambda **kwargs: tools.create_milestone(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "update_milestone",
-            "Update an existing milestone",
-            lambda **kwargs: tools.update_milestone(self.gitlab_client, **kwargs),
-        )
-
-        # Label tools
-        self.register_tool(
-            "list_labels",
-            "List labels for a project",
-            lambda **kwargs: tools.list_labels(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "create_label",
-            "Create a new label",
-            lambda **kwargs: tools.create_label(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "update_label",
-            "Update an existing label",
-            lambda **kwargs: tools.update_label(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "delete_label",
-            "Delete a label",
-            lambda **kwargs: tools.delete_label(self.gitlab_client, **kwargs),
-        )
-
-        # Wiki tools
-        self.register_tool(
-            "list_wiki_pages",
-            "List wiki pages for a project",
-            lambda **kwargs: tools.list_wiki_pages(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "get_wiki_page",
-            "Get content of a specific wiki page",
-            lambda **kwargs: tools.get_wiki_page(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "create_wiki_page",
-            "Create a new wiki page",
-            lambda **kwargs: tools.create_wiki_page(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "update_wiki_page",
-            "Update an existing wiki page",
-            lambda **kwargs: tools.update_wiki_page(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "delete_wiki_page",
-            "Delete a wiki page",
-            lambda **kwargs: tools.delete_wiki_page(self.gitlab_client, **kwargs),
-        )
-
-        # Snippet tools
-        self.register_tool(
-            "list_snippets",
-            "List snippets for a project",
-            lambda **kwargs: tools.list_snippets(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "get_snippet",
-            "Get content of a specific snippet",
-            lambda **kwargs: tools.get_snippet(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "create_snippet",
-            "Create a new snippet",
-            lambda **kwargs: tools.create_snippet(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "update_snippet",
-            "Update an existing snippet",
-            lambda **kwargs: tools.update_snippet(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "delete_snippet",
-            "Delete a snippet",
-            lambda **kwargs: tools.delete_snippet(self.gitlab_client, **kwargs),
-        )
-
-        # Release tools
-        self.register_tool(
-            "list_releases",
-            "List releases for a project",
-            lambda **kwargs: tools.list_releases(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "get_release",
-            "Get details of a specific release",
-            lambda **kwargs: tools.get_release(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "create_release",
-            "Create a new release",
-            lambda **kwargs: tools.create_release(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "update_release",
-            "Update an existing release",
-            lambda **kwargs: tools.update_release(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "delete_release",
-            "Delete a release",
-            lambda **kwargs: tools.delete_release(self.gitlab_client, **kwargs),
-        )
-
-        # User tools
-        self.register_tool(
-            "get_user",
-            "Get details of a specific user",
-            lambda **kwargs: tools.get_user(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "search_users",
-            "Search for users by username or email",
-            lambda **kwargs: tools.search_users(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "list_user_projects",
-            "List projects for a specific user",
-            lambda **kwargs: tools.list_user_projects(self.gitlab_client, **kwargs),
-        )
-
-        # Group tools
-        self.register_tool(
-            "list_groups",
-            "List groups accessible by the user",
-            lambda **kwargs: tools.list_groups(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "get_group",
-            "Get details of a specific group",
-            lambda **kwargs: tools.get_group(self.gitlab_client, **kwargs),
-        )
-        self.register_tool(
-            "list_group_members",
-            "List members of a group",
-            lambda **kwargs: tools.list_group_members(self.gitlab_client, **kwargs),
-        )
+        # Descriptions live in the schema table, so bind each tool function to
+        # the client directly instead of maintaining a second name/description list
+        for name, description, _ in _get_tool_definitions():
+            self.register_tool(
+                name, description, functools.partial(getattr(tools, name), self.gitlab_client)
+            )
 
     async def startup(self) -> None:
         """
         Start the MCP server.
 
-        Authenticates with GitLab and prepares the server for handling requests.
+        Authenticates with GitLab and, while that request is in flight, builds
+        the list_tools response so the first client call does not pay for it.
 
         Raises:
             NetworkError: If connection to GitLab fails
             AuthenticationError: If authentication fails
         """
-        await asyncio.sleep(0)  # Allow event loop to process other tasks
-        # Authenticate with GitLab
-        self.gitlab_client.authenticate()
+        # Authentication is a blocking HTTP round-trip, so keep it off the event loop
+        await asyncio.gather(
+            asyncio.to_thread(self.gitlab_client.authenticate),
+            self.list_tools(),
+        )
 
     async def shutdown(self) -> None:
         """
@@ -914,7 +731,6 @@ class GitLabMCPServer:
 
         Performs cleanup operations before server shutdown.
         """
-        await asyncio.sleep(0)  # Allow event loop to process other tasks
         # Currently no cleanup needed, but method exists for future use
 
     async def list_tools(self) -> list[dict[str, Any]]:
@@ -922,12 +738,15 @@ class GitLabMCPServer:
         List all available MCP tools.
 
         Returns:
-            List of tool dictionaries with name and description
+            List of tool dictionaries with name and description. The list is
+            cached between registrations and must not be mutated by callers.
         """
-        await asyncio.sleep(0)  # Allow event loop to process other tasks
-        return [
-            {"name": name, "description": tool["description"]} for name, tool in self._tools.items()
-        ]
+        if self._tool_list is None:
+            self._tool_list = [
+                {"name": name, "description": tool.description}
+                for name, tool in self._tools.items()
+            ]
+        return self._tool_list
 
     def register_tool(self, name: str, description: str, function: Callable[..., Any]) -> None:
         """
@@ -936,13 +755,13 @@ class GitLabMCPServer:
         Args:
             name: Tool name
             description: Tool description
-            function: Tool function to execute
+            function: Tool function to execute (async, or sync to run in a thread)
         """
-        self._tools[name] = {
-            "name": name,
-            "description": description,
-            "function": function,
-        }
+        # is_async is checked once here so call_tool does not re-inspect on every call
+        self._tools[name] = ToolEntry(
+            name, description, function, inspect.iscoroutinefunction(function)
+        )
+        self._tool_list = None
 
     async def call_tool(self, name: str, arguments: dict[str, Any]) -> Any:
         """
@@ -958,11 +777,20 @@ class GitLabMCPServer:
         Raises:
             ValueError: If tool is not found
         """
-        if name not in self._tools:
+        tool = self._tools.get(name)
+        if tool is None:
             raise ValueError(f"Tool '{name}' not found")
 
-        tool_function = self._tools[name]["function"]
-        return await tool_function(**arguments)
+        # Registered functions are partials with the client already bound,
+        # so the arguments dict is forwarded without a wrapper frame
+        if tool.is_async:
+            return await tool.function(**arguments)
+        # Synchronous tools run in a worker thread to keep the event loop free
+        result = await asyncio.to_thread(tool.function, **arguments)
+        # Wrappers such as lambdas may hand back a coroutine from a plain call
+        if inspect.isawaitable(result):
+            return await result
+        return result
 
     def get_info(self) -> dict[str, str]:
         """
@@ -971,1371 +799,1106 @@ class GitLabMCPServer:
         Returns:
             Dictionary with server name, version, and description
         """
-        return {
-            "name": self.name,
-            "version": "0.1.0",
-            "description": "GitLab MCP Server - Model Context Protocol server for GitLab",
-        }
+        return {"name": self.name, **_SERVER_INFO}
+
+
+class ToolDefinition(NamedTuple):
+    """An advertised tool: its name, description and parameter definitions."""
+
+    name: str
+    description: str
+    params: dict[str, Any]
+
+
+# Static tool schemas, built once at import and shared by every caller
+_TOOL_DEFINITIONS: tuple[ToolDefinition, ...] = (
+    # Context tools (1)
+    ToolDefinition(
+        "get_current_context", "Get current GitLab user and server context information", {}
+    ),
+    # Repository tools (6)
+    ToolDefinition(
+        "list_repository_tree",
+        "List files and directories in a repository tree",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "path": {"type": "string", "description": "Path in repository (optional)"},
+            "ref": {
+                "type": "string",
+                "description": "Branch, tag, or commit SHA (optional, default: HEAD)",
+            },
+            "recursive": {
+                "type": "boolean",
+                "description": "List recursively (optional, default: false)",
+            },
+        },
+    ),
+    ToolDefinition(
+        "get_file_contents",
+        "Get the contents of a file from a repository",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "file_path": {"type": "string", "description": "Path to file in repository"},
+            "ref": {
+                "type": "string",
+                "description": "Branch, tag, or commit SHA (optional, default: HEAD)",
+            },
+        },
+    ),
+    ToolDefinition(
+        "search_code",
+        "Search for code in project repositories",
+        {
+            "search_term": {"type": "string", "description": DESC_SEARCH_QUERY},
+            "project_id": {
+                "type": "string",
+                "description": "Project ID or path (optional, search all accessible projects if not specified)",
+            },
+        },
+    ),
+    ToolDefinition(
+        "create_file",
+        "Create a new file in a repository with commit",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "file_path": {
+                "type": "string",
+                "description": "Full path for the new file (e.g., 'src/main.py')",
+            },
+            "branch": {
+                "type": "string",
+                "description": "Name of the branch to create the file in",
+            },
+            "content": {
+                "type": "string",
+                "description": "Content of the file (text or base64-encoded)",
+            },
+            "commit_message": {
+                "type": "string",
+                "description": "Commit message for the file creation",
+            },
+            "author_email": _PARAM_AUTHOR_EMAIL,
+            "author_name": _PARAM_AUTHOR_NAME,
+            "encoding": {
+                "type": "string",
+                "description": "Content encoding: 'text' or 'base64' (optional, default: text)",
+            },
+        },
+    ),
+    ToolDefinition(
+        "update_file",
+        "Update existing file content with commit",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "file_path": {"type": "string", "description": "Full path to the file to update"},
+            "branch": {
+                "type": "string",
+                "description": "Name of the branch containing the file",
+            },
+            "content": {
+                "type": "string",
+                "description": "New content for the file (text or base64-encoded)",
+            },
+            "commit_message": {
+                "type": "string",
+                "description": "Commit message for the file update",
+            },
+            "author_email": _PARAM_AUTHOR_EMAIL,
+            "author_name": _PARAM_AUTHOR_NAME,
+            "encoding": {
+                "type": "string",
+                "description": "Content encoding: 'text' or 'base64' (optional, default: text)",
+            },
+        },
+    ),
+    ToolDefinition(
+        "delete_file",
+        "Delete a file from repository with commit",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "file_path": {"type": "string", "description": "Full path to the file to delete"},
+            "branch": {
+                "type": "string",
+                "description": "Name of the branch containing the file",
+            },
+            "commit_message": {
+                "type": "string",
+                "description": "Commit message for the file deletion",
+            },
+            "author_email": _PARAM_AUTHOR_EMAIL,
+            "author_name": _PARAM_AUTHOR_NAME,
+        },
+    ),
+    ToolDefinition(
+        "list_branches",
+        "List all branches in a repository",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "search": {
+                "type": "string",
+                "description": "Search term to filter branches (optional)",
+            },
+            "page": _PARAM_PAGE,
+            "per_page": _PARAM_PER_PAGE,
+        },
+    ),
+    ToolDefinition(
+        "get_branch",
+        "Get details of a specific branch",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "branch_name": {"type": "string", "description": "Name of the branch"},
+        },
+    ),
+    ToolDefinition(
+        "create_branch",
+        "Create a new branch",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "branch_name": {"type": "string", "description": "Name for the new branch"},
+            "ref": {"type": "string", "description": DESC_SOURCE_REF},
+        },
+    ),
+    ToolDefinition(
+        "delete_branch",
+        "Delete a branch",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "branch_name": {"type": "string", "description": "Name of branch to delete"},
+        },
+    ),
+    ToolDefinition(
+        "get_commit",
+        "Get details of a specific commit",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "commit_sha": {"type": "string", "description": "Commit SHA"},
+        },
+    ),
+    ToolDefinition(
+        "list_commits",
+        "List commits for a project or branch",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "ref": {"type": "string", "description": "Branch/tag name (optional)"},
+            "since": {
+                "type": "string",
+                "description": "Only commits after this date (ISO 8601, optional)",
+            },
+            "until": {
+                "type": "string",
+                "description": "Only commits before this date (ISO 8601, optional)",
+            },
+            "path": {
+                "type": "string",
+                "description": "Only commits affecting this file path (optional)",
+            },
+            "page": _PARAM_PAGE,
+            "per_page": _PARAM_PER_PAGE,
+        },
+    ),
+    ToolDefinition(
+        "compare_branches",
+        "Compare two branches, tags, or commits",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "from_ref": {"type": "string", "description": DESC_SOURCE_REF},
+            "to_ref": {"type": "string", "description": "Target branch, tag, or commit SHA"},
+            "straight": {
+                "type": "boolean",
+                "description": "Compare refs directly without merge base (optional)",
+            },
+        },
+    ),
+    ToolDefinition(
+        "list_tags",
+        "List repository tags",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "search": {
+                "type": "string",
+                "description": "Search pattern to filter tags (optional)",
+            },
+            "page": _PARAM_PAGE,
+            "per_page": _PARAM_PER_PAGE,
+        },
+    ),
+    ToolDefinition(
+        "get_tag",
+        "Get details of a specific tag",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "tag_name": {"type": "string", "description": "Name of the tag"},
+        },
+    ),
+    ToolDefinition(
+        "create_tag",
+        "Create a new tag",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "tag_name": {"type": "string", "description": "Name for the new tag"},
+            "ref": {"type": "string", "description": DESC_SOURCE_REF},
+            "message": {
+                "type": "string",
+                "description": "Optional tag message (creates annotated tag)",
+            },
+        },
+    ),
+    # Issue tools (3)
+    ToolDefinition(
+        "list_issues",
+        "List issues for a project",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "state": {
+                "type": "string",
+                "description": "Filter by state: opened, closed, all (optional, default: opened)",
+            },
+            "labels": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Filter by labels (optional)",
+            },
+            "milestone": {
+                "type": "string",
+                "description": "Filter by milestone title (optional)",
+            },
+            "author_id": {"type": "integer", "description": "Filter by author ID (optional)"},
+            "assignee_id": {
+                "type": "integer",
+                "description": "Filter by assignee ID (optional)",
+            },
+            "per_page": _PARAM_PER_PAGE,
+        },
+    ),
+    ToolDefinition(
+        "get_issue",
+        "Get details of a specific issue",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "issue_iid": _PARAM_ISSUE_IID,
+        },
+    ),
+    ToolDefinition(
+        "create_issue",
+        "Create a new issue in a project",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "title": {"type": "string", "description": "Issue title"},
+            "description": {"type": "string", "description": "Issue description (optional)"},
+            "labels": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Labels (optional)",
+            },
+            "assignee_ids": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "Assignee user IDs (optional)",
+            },
+            "milestone_id": {"type": "integer", "description": "Milestone ID (optional)"},
+        },
+    ),
+    ToolDefinition(
+        "update_issue",
+        "Update an existing issue",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "issue_iid": _PARAM_ISSUE_IID,
+            "title": _PARAM_NEW_TITLE,
+            "description": _PARAM_NEW_DESC,
+            "labels": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "New labels (optional)",
+            },
+            "assignee_ids": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "New assignee user IDs (optional)",
+            },
+            "milestone_id": {"type": "integer", "description": "New milestone ID (optional)"},
+            "state_event": {
+                "type": "string",
+                "description": "State event: close, reopen (optional)",
+            },
+        },
+    ),
+    ToolDefinition(
+        "close_issue",
+        "Close an issue",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "issue_iid": _PARAM_ISSUE_IID,
+        },
+    ),
+    ToolDefinition(
+        "reopen_issue",
+        "Reopen a closed issue",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "issue_iid": _PARAM_ISSUE_IID,
+        },
+    ),
+    ToolDefinition(
+        "add_issue_comment",
+        "Add a comment to an issue",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "issue_iid": _PARAM_ISSUE_IID,
+            "body": {"type": "string", "description": "Comment text (supports Markdown)"},
+        },
+    ),
+    ToolDefinition(
+        "list_issue_comments",
+        "List all comments on an issue",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "issue_iid": _PARAM_ISSUE_IID,
+            "page": _PARAM_PAGE,
+            "per_page": _PARAM_PER_PAGE,
+        },
+    ),
+    # Merge Request tools (12)
+    ToolDefinition(
+        "list_merge_requests",
+        "List merge requests for a project",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "state": {
+                "type": "string",
+                "description": "Filter by state: opened, closed, merged, all (optional, default: opened)",
+            },
+            "labels": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Filter by labels (optional)",
+            },
+            "milestone": {
+                "type": "string",
+                "description": "Filter by milestone title (optional)",
+            },
+            "author_id": {"type": "integer", "description": "Filter by author ID (optional)"},
+            "assignee_id": {
+                "type": "integer",
+                "description": "Filter by assignee ID (optional)",
+            },
+            "per_page": _PARAM_PER_PAGE,
+        },
+    ),
+    ToolDefinition(
+        "get_merge_request",
+        "Get details of a specific merge request",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "mr_iid": _PARAM_MR_IID,
+        },
+    ),
+    ToolDefinition(
+        "create_merge_request",
+        "Create a new merge request",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "source_branch": {"type": "string", "description": "Source branch name"},
+            "target_branch": {"type": "string", "description": "Target branch name"},
+            "title": {"type": "string", "description": "MR title"},
+            "description": {"type": "string", "description": "MR description (optional)"},
+            "labels": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Labels (optional)",
+            },
+            "assignee_ids": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "Assignee user IDs (optional)",
+            },
+            "milestone_id": {"type": "integer", "description": "Milestone ID (optional)"},
+        },
+    ),
+    ToolDefinition(
+        "update_merge_request",
+        "Update an existing merge request",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "mr_iid": _PARAM_MR_IID,
+            "title": _PARAM_NEW_TITLE,
+            "description": _PARAM_NEW_DESC,
+            "labels": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "New labels (optional)",
+            },
+            "assignee_ids": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "New assignee user IDs (optional)",
+            },
+            "milestone_id": {"type": "integer", "description": "New milestone ID (optional)"},
+        },
+    ),
+    ToolDefinition(
+        "merge_merge_request",
+        "Merge an approved merge request",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "mr_iid": _PARAM_MR_IID,
+            "merge_commit_message": {
+                "type": "string",
+                "description": "Merge commit message (optional)",
+            },
+            "should_remove_source_branch": {
+                "type": "boolean",
+                "description": "Remove source branch after merge (optional)",
+            },
+        },
+    ),
+    ToolDefinition(
+        "close_merge_request",
+        "Close a merge request without merging",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "mr_iid": _PARAM_MR_IID,
+        },
+    ),
+    ToolDefinition(
+        "reopen_merge_request",
+        "Reopen a closed merge request",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "mr_iid": _PARAM_MR_IID,
+        },
+    ),
+    ToolDefinition(
+        "approve_merge_request",
+        "Approve a merge request",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "mr_iid": _PARAM_MR_IID,
+        },
+    ),
+    ToolDefinition(
+        "unapprove_merge_request",
+        "Remove approval from a merge request",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "mr_iid": _PARAM_MR_IID,
+        },
+    ),
+    ToolDefinition(
+        "get_merge_request_changes",
+        "Get the file changes in a merge request",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "mr_iid": _PARAM_MR_IID,
+        },
+    ),
+    ToolDefinition(
+        "get_merge_request_commits",
+        "Get commits in a merge request",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "mr_iid": _PARAM_MR_IID,
+        },
+    ),
+    ToolDefinition(
+        "get_merge_request_pipelines",
+        "Get pipelines for a merge request",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "mr_iid": _PARAM_MR_IID,
+        },
+    ),
+    ToolDefinition(
+        "add_mr_comment",
+        "Add a comment to a merge request",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "mr_iid": _PARAM_MR_IID,
+            "body": {"type": "string", "description": "Comment text (supports Markdown)"},
+        },
+    ),
+    ToolDefinition(
+        "list_mr_comments",
+        "List all comments on a merge request",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "mr_iid": _PARAM_MR_IID,
+            "page": _PARAM_PAGE,
+            "per_page": _PARAM_PER_PAGE,
+        },
+    ),
+    # Pipeline tools (14)
+    ToolDefinition(
+        "list_pipelines",
+        "List pipelines for a project",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "ref": {"type": "string", "description": "Filter by branch/tag (optional)"},
+            "status": {
+                "type": "string",
+                "description": "Filter by status: running, pending, success, failed, canceled (optional)",
+            },
+            "per_page": _PARAM_PER_PAGE,
+        },
+    ),
+    ToolDefinition(
+        "get_pipeline",
+        "Get details of a specific pipeline",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "pipeline_id": _PARAM_PIPELINE_ID,
+        },
+    ),
+    ToolDefinition(
+        "create_pipeline",
+        "Create a new pipeline",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "ref": {"type": "string", "description": "Branch or tag name"},
+            "variables": {"type": "object", "description": "Pipeline variables (optional)"},
+        },
+    ),
+    ToolDefinition(
+        "retry_pipeline",
+        "Retry a failed pipeline",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "pipeline_id": _PARAM_PIPELINE_ID,
+        },
+    ),
+    ToolDefinition(
+        "cancel_pipeline",
+        "Cancel a running pipeline",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "pipeline_id": _PARAM_PIPELINE_ID,
+        },
+    ),
+    ToolDefinition(
+        "delete_pipeline",
+        "Delete a pipeline",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "pipeline_id": _PARAM_PIPELINE_ID,
+        },
+    ),
+    ToolDefinition(
+        "list_pipeline_jobs",
+        "List jobs in a pipeline",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "pipeline_id": _PARAM_PIPELINE_ID,
+        },
+    ),
+    ToolDefinition(
+        "get_job",
+        "Get details of a specific job",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "job_id": _PARAM_JOB_ID,
+        },
+    ),
+    ToolDefinition(
+        "get_job_trace",
+        "Get the trace log of a job. Use tail_lines parameter to limit output for large logs.",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "job_id": _PARAM_JOB_ID,
+            "tail_lines": {
+                "type": "integer",
+                "description": "Optional: Number of lines to return from end of log (e.g., 500-1000 for error analysis). Prevents exceeding token limits on large logs.",
+            },
+        },
+    ),
+    ToolDefinition(
+        "retry_job",
+        "Retry a failed job",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "job_id": _PARAM_JOB_ID,
+        },
+    ),
+    ToolDefinition(
+        "cancel_job",
+        "Cancel a running job",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "job_id": _PARAM_JOB_ID,
+        },
+    ),
+    ToolDefinition(
+        "play_job",
+        "Play a manual job",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "job_id": _PARAM_JOB_ID,
+        },
+    ),
+    ToolDefinition(
+        "download_job_artifacts",
+        "Download artifacts from a job",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "job_id": _PARAM_JOB_ID,
+            "artifact_path": {
+                "type": "string",
+                "description": "Path to specific artifact (optional, download all if not specified)",
+            },
+        },
+    ),
+    ToolDefinition(
+        "list_pipeline_variables",
+        "List variables for a pipeline",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "pipeline_id": _PARAM_PIPELINE_ID,
+        },
+    ),
+    # Project tools (9)
+    ToolDefinition(
+        "list_projects",
+        "List projects accessible by the user",
+        {
+            "visibility": {
+                "type": "string",
+                "description": "Filter by visibility: public, internal, private (optional)",
+            },
+            "owned": {"type": "boolean", "description": "Limit to owned projects (optional)"},
+            "membership": {
+                "type": "boolean",
+                "description": "Limit to projects where user is a member (optional)",
+            },
+            "per_page": _PARAM_PER_PAGE,
+        },
+    ),
+    ToolDefinition(
+        "get_project",
+        "Get details of a specific project",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+        },
+    ),
+    ToolDefinition(
+        "create_project",
+        "Create a new project in GitLab",
+        {
+            "name": {
+                "type": "string",
+                "description": "Project name (required)",
+            },
+            "path": {
+                "type": "string",
+                "description": "Project path/slug (optional, defaults to name if not provided)",
+            },
+            "namespace_id": {
+                "type": "integer",
+                "description": "ID of the namespace/group to create project in (optional)",
+            },
+            "description": {
+                "type": "string",
+                "description": "Project description (optional)",
+            },
+            "visibility": {
+                "type": "string",
+                "description": "Project visibility: 'private', 'internal', or 'public' (optional, default: private)",
+            },
+            "initialize_with_readme": {
+                "type": "boolean",
+                "description": "Initialize project with a README.md (optional, default: false)",
+            },
+        },
+    ),
+    ToolDefinition(
+        "search_projects",
+        "Search for projects by name or description",
+        {
+            "search_term": {"type": "string", "description": DESC_SEARCH_QUERY},
+        },
+    ),
+    ToolDefinition(
+        "list_project_members",
+        "List members of a project",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+        },
+    ),
+    ToolDefinition(
+        "get_project_statistics",
+        "Get statistics for a project",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+        },
+    ),
+    ToolDefinition(
+        "list_milestones",
+        "List milestones for a project",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "state": {
+                "type": "string",
+                "description": "Filter by state: active, closed, all (optional, default: active)",
+            },
+        },
+    ),
+    ToolDefinition(
+        "get_milestone",
+        "Get details of a specific milestone",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "milestone_id": {"type": "integer", "description": "Milestone ID"},
+        },
+    ),
+    ToolDefinition(
+        "create_milestone",
+        "Create a new milestone",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "title": {"type": "string", "description": "Milestone title"},
+            "description": {
+                "type": "string",
+                "description": "Milestone description (optional)",
+            },
+            "due_date": {
+                "type": "string",
+                "description": "Due date (YYYY-MM-DD format, optional)",
+            },
+            "start_date": {
+                "type": "string",
+                "description": "Start date (YYYY-MM-DD format, optional)",
+            },
+        },
+    ),
+    ToolDefinition(
+        "update_milestone",
+        "Update an existing milestone",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "milestone_id": {"type": "integer", "description": "Milestone ID"},
+            "title": _PARAM_NEW_TITLE,
+            "description": _PARAM_NEW_DESC,
+            "due_date": {
+                "type": "string",
+                "description": "New due date (YYYY-MM-DD format, optional)",
+            },
+            "start_date": {
+                "type": "string",
+                "description": "New start date (YYYY-MM-DD format, optional)",
+            },
+            "state_event": {
+                "type": "string",
+                "description": "State event: close, activate (optional)",
+            },
+        },
+    ),
+    # Label tools (4)
+    ToolDefinition(
+        "list_labels",
+        "List labels for a project",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+        },
+    ),
+    ToolDefinition(
+        "create_label",
+        "Create a new label",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "name": {"type": "string", "description": "Label name"},
+            "color": {
+                "type": "string",
+                "description": "Label color (hex format, e.g., '#FF0000')",
+            },
+            "description": {"type": "string", "description": "Label description (optional)"},
+        },
+    ),
+    ToolDefinition(
+        "update_label",
+        "Update an existing label",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "name": {"type": "string", "description": "Current label name"},
+            "new_name": {"type": "string", "description": "New label name (optional)"},
+            "color": {"type": "string", "description": "New color (hex format, optional)"},
+            "description": _PARAM_NEW_DESC,
+        },
+    ),
+    ToolDefinition(
+        "delete_label",
+        "Delete a label",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "name": {"type": "string", "description": "Label name"},
+        },
+    ),
+    # Wiki tools (5)
+    ToolDefinition(
+        "list_wiki_pages",
+        "List wiki pages for a project",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+        },
+    ),
+    ToolDefinition(
+        "get_wiki_page",
+        "Get content of a specific wiki page",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "slug": _PARAM_WIKI_SLUG,
+        },
+    ),
+    ToolDefinition(
+        "create_wiki_page",
+        "Create a new wiki page",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "title": {"type": "string", "description": "Page title"},
+            "content": {"type": "string", "description": "Page content (Markdown format)"},
+        },
+    ),
+    ToolDefinition(
+        "update_wiki_page",
+        "Update an existing wiki page",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "slug": _PARAM_WIKI_SLUG,
+            "title": {"type": "string", "description": "New page title (optional)"},
+            "content": {"type": "string", "description": "New page content (optional)"},
+        },
+    ),
+    ToolDefinition(
+        "delete_wiki_page",
+        "Delete a wiki page",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "slug": _PARAM_WIKI_SLUG,
+        },
+    ),
+    # Snippet tools (5)
+    ToolDefinition(
+        "list_snippets",
+        "List snippets for a project",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+        },
+    ),
+    ToolDefinition(
+        "get_snippet",
+        "Get content of a specific snippet",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "snippet_id": _PARAM_SNIPPET_ID,
+        },
+    ),
+    ToolDefinition(
+        "create_snippet",
+        "Create a new snippet",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "title": {"type": "string", "description": "Snippet title"},
+            "file_name": {"type": "string", "description": "File name"},
+            "content": {"type": "string", "description": "Snippet content"},
+            "visibility": {
+                "type": "string",
+                "description": "Visibility: private, internal, public (optional, default: private)",
+            },
+        },
+    ),
+    ToolDefinition(
+        "update_snippet",
+        "Update an existing snippet",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "snippet_id": _PARAM_SNIPPET_ID,
+            "title": _PARAM_NEW_TITLE,
+            "file_name": {"type": "string", "description": "New file name (optional)"},
+            "content": {"type": "string", "description": "New content (optional)"},
+            "visibility": {"type": "string", "description": "New visibility (optional)"},
+        },
+    ),
+    ToolDefinition(
+        "delete_snippet",
+        "Delete a snippet",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "snippet_id": _PARAM_SNIPPET_ID,
+        },
+    ),
+    # Release tools (5)
+    ToolDefinition(
+        "list_releases",
+        "List releases for a project",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+        },
+    ),
+    ToolDefinition(
+        "get_release",
+        "Get details of a specific release",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "tag_name": {
+                "type": "string",
+                "description": DESC_TAG_RELEASE,
+            },
+        },
+    ),
+    ToolDefinition(
+        "create_release",
+        "Create a new release",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "tag_name": _PARAM_TAG_NAME,
+            "name": {"type": "string", "description": "Release name"},
+            "description": {"type": "string", "description": "Release description (optional)"},
+            "ref": {
+                "type": "string",
+                "description": "Commit SHA, branch, or tag (optional, default: default branch)",
+            },
+        },
+    ),
+    ToolDefinition(
+        "update_release",
+        "Update an existing release",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "tag_name": _PARAM_TAG_NAME,
+            "name": {"type": "string", "description": "New release name (optional)"},
+            "description": {
+                "type": "string",
+                "description": "New release description (optional)",
+            },
+        },
+    ),
+    ToolDefinition(
+        "delete_release",
+        "Delete a release",
+        {
+            "project_id": _PARAM_PROJECT_ID,
+            "tag_name": _PARAM_TAG_NAME,
+        },
+    ),
+    # User tools (3)
+    ToolDefinition(
+        "get_user",
+        "Get details of a specific user",
+        {
+            "user_id": {"type": "integer", "description": "User ID"},
+        },
+    ),
+    ToolDefinition(
+        "search_users",
+        "Search for users by username or email",
+        {
+            "search": {"type": "string", "description": DESC_SEARCH_QUERY},
+        },
+    ),
+    ToolDefinition(
+        "list_user_projects",
+        "List projects for a specific user",
+        {
+            "user_id": {"type": "integer", "description": "User ID"},
+        },
+    ),
+    # Group tools (3)
+    ToolDefinition(
+        "list_groups",
+        "List groups accessible by the user",
+        {
+            "owned": {"type": "boolean", "description": "Limit to owned groups (optional)"},
+            "per_page": _PARAM_PER_PAGE,
+        },
+    ),
+    ToolDefinition(
+        "get_group",
+        "Get details of a specific group",
+        {
+            "group_id": {"type": "string", "description": "Group ID or path"},
+        },
+    ),
+    ToolDefinition(
+        "list_group_members",
+        "List members of a group",
+        {
+            "group_id": {"type": "string", "description": "Group ID or path"},
+        },
+    ),
+)
+
+# Parameter names per tool, for building cache keys of calls made through execute_tool
+_TOOL_PARAM_NAMES: dict[str, tuple[str, ...]] = {
+    tool_def.name: tuple(tool_def.params) for tool_def in _TOOL_DEFINITIONS
+}
 
 
-def _get_tool_definitions() -> list[tuple[str, str, dict[str, Any]]]:
+def _get_tool_definitions() -> list[ToolDefinition]:
     """
     Get tool definitions with JSON schemas for all 87 GitLab MCP tools.
 
+    The schema dicts are shared module state and must not be mutated;
+    _build_tool_schema copies them when building input schemas.
+
     Returns:
-        List of tuples: (name, description, input_schema)
+        List of ToolDefinition tuples: (name, description, params)
     """
-    return [
-        # Context tools (1)
-        ("get_current_context", "Get current GitLab user and server context information", {}),
-        # Repository tools (6)
-        (
-            "list_repository_tree",
-            "List files and directories in a repository tree",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "path": {"type": "string", "description": "Path in repository (optional)"},
-                "ref": {
-                    "type": "string",
-                    "description": "Branch, tag, or commit SHA (optional, default: HEAD)",
-                },
-                "recursive": {
-                    "type": "boolean",
-                    "description": "List recursively (optional, default: false)",
-                },
-            },
-        ),
-        (
-            "get_file_contents",
-            "Get the contents of a file from a repository",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "file_path": {"type": "string", "description": "Path to file in repository"},
-                "ref": {
-                    "type": "string",
-                    "description": "Branch, tag, or commit SHA (optional, default: HEAD)",
-                },
-            },
-        ),
-        (
-            "search_code",
-            "Search for code in project repositories",
-            {
-                "search_term": {"type": "string", "description": DESC_SEARCH_QUERY},
-                "project_id": {
-                    "type": "string",
-                    "description": "Project ID or path (optional, search all accessible projects if not specified)",
-                },
-            },
-        ),
-        (
-            "create_file",
-            "Create a new file in a repository with commit",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "file_path": {
-                    "type": "string",
-                    "description": "Full path for the new file (e.g., 'src/main.py')",
-                },
-                "branch": {
-                    "type": "string",
-                    "description": "Name of the branch to create the file in",
-                },
-                "content": {
-                    "type": "string",
-                    "description": "Content of the file (text or base64-encoded)",
-                },
-                "commit_message": {
-                    "type": "string",
-                    "description": "Commit message for the file creation",
-                },
-                "author_email": {
-                    "type": "string",
-                    "description": DESC_AUTHOR_EMAIL,
-                },
-                "author_name": {
-                    "type": "string",
-                    "description": DESC_AUTHOR_NAME,
-                },
-                "encoding": {
-                    "type": "string",
-                    "description": "Content encoding: 'text' or 'base64' (optional, default: text)",
-                },
-            },
-        ),
-        (
-            "update_file",
-            "Update existing file content with commit",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "file_path": {"type": "string", "description": "Full path to the file to update"},
-                "branch": {
-                    "type": "string",
-                    "description": "Name of the branch containing the file",
-                },
-                "content": {
-                    "type": "string",
-                    "description": "New content for the file (text or base64-encoded)",
-                },
-                "commit_message": {
-                    "type": "string",
-                    "description": "Commit message for the file update",
-                },
-                "author_email": {
-                    "type": "string",
-                    "description": DESC_AUTHOR_EMAIL,
-                },
-                "author_name": {
-                    "type": "string",
-                    "description": DESC_AUTHOR_NAME,
-                },
-                "encoding": {
-                    "type": "string",
-                    "description": "Content encoding: 'text' or 'base64' (optional, default: text)",
-                },
-            },
-        ),
-        (
-            "delete_file",
-            "Delete a file from repository with commit",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "file_path": {"type": "string", "description": "Full path to the file to delete"},
-                "branch": {
-                    "type": "string",
-                    "description": "Name of the branch containing the file",
-                },
-                "commit_message": {
-                    "type": "string",
-                    "description": "Commit message for the file deletion",
-                },
-                "author_email": {
-                    "type": "string",
-                    "description": DESC_AUTHOR_EMAIL,
-                },
-                "author_name": {
-                    "type": "string",
-                    "description": DESC_AUTHOR_NAME,
-                },
-            },
-        ),
-        (
-            "list_branches",
-            "List all branches in a repository",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "search": {
-                    "type": "string",
-                    "description": "Search term to filter branches (optional)",
-                },
-                "page": {"type": "integer", "description": DESC_PAGE},
-                "per_page": {
-                    "type": "integer",
-                    "description": DESC_PER_PAGE,
-                },
-            },
-        ),
-        (
-            "get_branch",
-            "Get details of a specific branch",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "branch_name": {"type": "string", "description": "Name of the branch"},
-            },
-        ),
-        (
-            "create_branch",
-            "Create a new branch",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "branch_name": {"type": "string", "description": "Name for the new branch"},
-                "ref": {"type": "string", "description": DESC_SOURCE_REF},
-            },
-        ),
-        (
-            "delete_branch",
-            "Delete a branch",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "branch_name": {"type": "string", "description": "Name of branch to delete"},
-            },
-        ),
-        (
-            "get_commit",
-            "Get details of a specific commit",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "commit_sha": {"type": "string", "description": "Commit SHA"},
-            },
-        ),
-        (
-            "list_commits",
-            "List commits for a project or branch",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "ref": {"type": "string", "description": "Branch/tag name (optional)"},
-                "since": {
-                    "type": "string",
-                    "description": "Only commits after this date (ISO 8601, optional)",
-                },
-                "until": {
-                    "type": "string",
-                    "description": "Only commits before this date (ISO 8601, optional)",
-                },
-                "path": {
-                    "type": "string",
-                    "description": "Only commits affecting this file path (optional)",
-                },
-                "page": {"type": "integer", "description": DESC_PAGE},
-                "per_page": {
-                    "type": "integer",
-                    "description": DESC_PER_PAGE,
-                },
-            },
-        ),
-        (
-            "compare_branches",
-            "Compare two branches, tags, or commits",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "from_ref": {"type": "string", "description": DESC_SOURCE_REF},
-                "to_ref": {"type": "string", "description": "Target branch, tag, or commit SHA"},
-                "straight": {
-                    "type": "boolean",
-                    "description": "Compare refs directly without merge base (optional)",
-                },
-            },
-        ),
-        (
-            "list_tags",
-            "List repository tags",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "search": {
-                    "type": "string",
-                    "description": "Search pattern to filter tags (optional)",
-                },
-                "page": {"type": "integer", "description": DESC_PAGE},
-                "per_page": {
-                    "type": "integer",
-                    "description": DESC_PER_PAGE,
-                },
-            },
-        ),
-        (
-            "get_tag",
-            "Get details of a specific tag",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "tag_name": {"type": "string", "description": "Name of the tag"},
-            },
-        ),
-        (
-            "create_tag",
-            "Create a new tag",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "tag_name": {"type": "string", "description": "Name for the new tag"},
-                "ref": {"type": "string", "description": DESC_SOURCE_REF},
-                "message": {
-                    "type": "string",
-                    "description": "Optional tag message (creates annotated tag)",
-                },
-            },
-        ),
-        # Issue tools (3)
-        (
-            "list_issues",
-            "List issues for a project",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "state": {
-                    "type": "string",
-                    "description": "Filter by state: opened, closed, all (optional, default: opened)",
-                },
-                "labels": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Filter by labels (optional)",
-                },
-                "milestone": {
-                    "type": "string",
-                    "description": "Filter by milestone title (optional)",
-                },
-                "author_id": {"type": "integer", "description": "Filter by author ID (optional)"},
-                "assignee_id": {
-                    "type": "integer",
-                    "description": "Filter by assignee ID (optional)",
-                },
-                "per_page": {
-                    "type": "integer",
-                    "description": DESC_PER_PAGE,
-                },
-            },
-        ),
-        (
-            "get_issue",
-            "Get details of a specific issue",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "issue_iid": {"type": "integer", "description": DESC_ISSUE_IID},
-            },
-        ),
-        (
-            "create_issue",
-            "Create a new issue in a project",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "title": {"type": "string", "description": "Issue title"},
-                "description": {"type": "string", "description": "Issue description (optional)"},
-                "labels": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Labels (optional)",
-                },
-                "assignee_ids": {
-                    "type": "array",
-                    "items": {"type": "integer"},
-                    "description": "Assignee user IDs (optional)",
-                },
-                "milestone_id": {"type": "integer", "description": "Milestone ID (optional)"},
-            },
-        ),
-        (
-            "update_issue",
-            "Update an existing issue",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "issue_iid": {"type": "integer", "description": DESC_ISSUE_IID},
-                "title": {"type": "string", "description": DESC_NEW_TITLE},
-                "description": {"type": "string", "description": DESC_NEW_DESC},
-                "labels": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "New labels (optional)",
-                },
-                "assignee_ids": {
-                    "type": "array",
-                    "items": {"type": "integer"},
-                    "description": "New assignee user IDs (optional)",
-                },
-                "milestone_id": {"type": "integer", "description": "New milestone ID (optional)"},
-                "state_event": {
-                    "type": "string",
-                    "description": "State event: close, reopen (optional)",
-                },
-            },
-        ),
-        (
-            "close_issue",
-            "Close an issue",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "issue_iid": {"type": "integer", "description": DESC_ISSUE_IID},
-            },
-        ),
-        (
-            "reopen_issue",
-            "Reopen a closed issue",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "issue_iid": {"type": "integer", "description": DESC_ISSUE_IID},
-            },
-        ),
-        (
-            "add_issue_comment",
-            "Add a comment to an issue",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "issue_iid": {"type": "integer", "description": DESC_ISSUE_IID},
-                "body": {"type": "string", "description": "Comment text (supports Markdown)"},
-            },
-        ),
-        (
-            "list_issue_comments",
-            "List all comments on an issue",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "issue_iid": {"type": "integer", "description": DESC_ISSUE_IID},
-                "page": {"type": "integer", "description": DESC_PAGE},
-                "per_page": {
-                    "type": "integer",
-                    "description": DESC_PER_PAGE,
-                },
-            },
-        ),
-        # Merge Request tools (12)
-        (
-            "list_merge_requests",
-            "List merge requests for a project",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "state": {
-                    "type": "string",
-                    "description": "Filter by state: opened, closed, merged, all (optional, default: opened)",
-                },
-                "labels": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Filter by labels (optional)",
-                },
-                "milestone": {
-                    "type": "string",
-                    "description": "Filter by milestone title (optional)",
-                },
-                "author_id": {"type": "integer", "description": "Filter by author ID (optional)"},
-                "assignee_id": {
-                    "type": "integer",
-                    "description": "Filter by assignee ID (optional)",
-                },
-                "per_page": {
-                    "type": "integer",
-                    "description": DESC_PER_PAGE,
-                },
-            },
-        ),
-        (
-            "get_merge_request",
-            "Get details of a specific merge request",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "mr_iid": {"type": "integer", "description": DESC_MR_IID},
-            },
-        ),
-        (
-            "create_merge_request",
-            "Create a new merge request",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "source_branch": {"type": "string", "description": "Source branch name"},
-                "target_branch": {"type": "string", "description": "Target branch name"},
-                "title": {"type": "string", "description": "MR title"},
-                "description": {"type": "string", "description": "MR description (optional)"},
-                "labels": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Labels (optional)",
-                },
-                "assignee_ids": {
-                    "type": "array",
-                    "items": {"type": "integer"},
-                    "description": "Assignee user IDs (optional)",
-                },
-                "milestone_id": {"type": "integer", "description": "Milestone ID (optional)"},
-            },
-        ),
-        (
-            "update_merge_request",
-            "Update an existing merge request",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "mr_iid": {"type": "integer", "description": DESC_MR_IID},
-                "title": {"type": "string", "description": DESC_NEW_TITLE},
-                "description": {"type": "string", "description": DESC_NEW_DESC},
-                "labels": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "New labels (optional)",
-                },
-                "assignee_ids": {
-                    "type": "array",
-                    "items": {"type": "integer"},
-                    "description": "New assignee user IDs (optional)",
-                },
-                "milestone_id": {"type": "integer", "description": "New milestone ID (optional)"},
-            },
-        ),
-        (
-            "merge_merge_request",
-            "Merge an approved merge request",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "mr_iid": {"type": "integer", "description": DESC_MR_IID},
-                "merge_commit_message": {
-                    "type": "string",
-                    "description": "Merge commit message (optional)",
-                },
-                "should_remove_source_branch": {
-                    "type": "boolean",
-                    "description": "Remove source branch after merge (optional)",
-                },
-            },
-        ),
-        (
-            "close_merge_request",
-            "Close a merge request without merging",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "mr_iid": {"type": "integer", "description": DESC_MR_IID},
-            },
-        ),
-        (
-            "reopen_merge_request",
-            "Reopen a closed merge request",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "mr_iid": {"type": "integer", "description": DESC_MR_IID},
-            },
-        ),
-        (
-            "approve_merge_request",
-            "Approve a merge request",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "mr_iid": {"type": "integer", "description": DESC_MR_IID},
-            },
-        ),
-        (
-            "unapprove_merge_request",
-            "Remove approval from a merge request",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "mr_iid": {"type": "integer", "description": DESC_MR_IID},
-            },
-        ),
-        (
-            "get_merge_request_changes",
-            "Get the file changes in a merge request",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "mr_iid": {"type": "integer", "description": DESC_MR_IID},
-            },
-        ),
-        (
-            "get_merge_request_commits",
-            "Get commits in a merge request",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "mr_iid": {"type": "integer", "description": DESC_MR_IID},
-            },
-        ),
-        (
-            "get_merge_request_pipelines",
-            "Get pipelines for a merge request",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "mr_iid": {"type": "integer", "description": DESC_MR_IID},
-            },
-        ),
-        (
-            "add_mr_comment",
-            "Add a comment to a merge request",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "mr_iid": {"type": "integer", "description": DESC_MR_IID},
-                "body": {"type": "string", "description": "Comment text (supports Markdown)"},
-            },
-        ),
-        (
-            "list_mr_comments",
-            "List all comments on a merge request",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "mr_iid": {"type": "integer", "description": DESC_MR_IID},
-                "page": {"type": "integer", "description": DESC_PAGE},
-                "per_page": {
-                    "type": "integer",
-                    "description": DESC_PER_PAGE,
-                },
-            },
-        ),
-        # Pipeline tools (14)
-        (
-            "list_pipelines",
-            "List pipelines for a project",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "ref": {"type": "string", "description": "Filter by branch/tag (optional)"},
-                "status": {
-                    "type": "string",
-                    "description": "Filter by status: running, pending, success, failed, canceled (optional)",
-                },
-                "per_page": {
-                    "type": "integer",
-                    "description": DESC_PER_PAGE,
-                },
-            },
-        ),
-        (
-            "get_pipeline",
-            "Get details of a specific pipeline",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "pipeline_id": {"type": "integer", "description": DESC_PIPELINE_ID},
-            },
-        ),
-        (
-            "create_pipeline",
-            "Create a new pipeline",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "ref": {"type": "string", "description": "Branch or tag name"},
-                "variables": {"type": "object", "description": "Pipeline variables (optional)"},
-            },
-        ),
-        (
-            "retry_pipeline",
-            "Retry a failed pipeline",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "pipeline_id": {"type": "integer", "description": DESC_PIPELINE_ID},
-            },
-        ),
-        (
-            "cancel_pipeline",
-            "Cancel a running pipeline",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "pipeline_id": {"type": "integer", "description": DESC_PIPELINE_ID},
-            },
-        ),
-        (
-            "delete_pipeline",
-            "Delete a pipeline",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "pipeline_id": {"type": "integer", "description": DESC_PIPELINE_ID},
-            },
-        ),
-        (
-            "list_pipeline_jobs",
-            "List jobs in a pipeline",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "pipeline_id": {"type": "integer", "description": DESC_PIPELINE_ID},
-            },
-        ),
-        (
-            "get_job",
-            "Get details of a specific job",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "job_id": {"type": "integer", "description": DESC_JOB_ID},
-            },
-        ),
-        (
-            "get_job_trace",
-            "Get the trace log of a job. Use tail_lines parameter to limit output for large logs.",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "job_id": {"type": "integer", "description": DESC_JOB_ID},
-                "tail_lines": {
-                    "type": "integer",
-                    "description": "Optional: Number of lines to return from end of log (e.g., 500-1000 for error analysis). Prevents exceeding token limits on large logs.",
-                },
-            },
-        ),
-        (
-            "retry_job",
-            "Retry a failed job",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "job_id": {"type": "integer", "description": DESC_JOB_ID},
-            },
-        ),
-        (
-            "cancel_job",
-            "Cancel a running job",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "job_id": {"type": "integer", "description": DESC_JOB_ID},
-            },
-        ),
-        (
-            "play_job",
-            "Play a manual job",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "job_id": {"type": "integer", "description": DESC_JOB_ID},
-            },
-        ),
-        (
-            "download_job_artifacts",
-            "Download artifacts from a job",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "job_id": {"type": "integer", "description": DESC_JOB_ID},
-                "artifact_path": {
-                    "type": "string",
-                    "description": "Path to specific artifact (optional, download all if not specified)",
-                },
-            },
-        ),
-        (
-            "list_pipeline_variables",
-            "List variables for a pipeline",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "pipeline_id": {"type": "integer", "description": DESC_PIPELINE_ID},
-            },
-        ),
-        # Project tools (9)
-        (
-            "list_projects",
-            "List projects accessible by the user",
-            {
-                "visibility": {
-                    "type": "string",
-                    "description": "Filter by visibility: public, internal, private (optional)",
-                },
-                "owned": {"type": "boolean", "description": "Limit to owned projects (optional)"},
-                "membership": {
-                    "type": "boolean",
-                    "description": "Limit to projects where user is a member (optional)",
-                },
-                "per_page": {
-                    "type": "integer",
-                    "description": DESC_PER_PAGE,
-                },
-            },
-        ),
-        (
-            "get_project",
-            "Get details of a specific project",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-            },
-        ),
-        (
-            "create_project",
-            "Create a new project in GitLab",
-            {
-                "name": {
-                    "type": "string",
-                    "description": "Project name (required)",
-                },
-                "path": {
-                    "type": "string",
-                    "description": "Project path/slug (optional, defaults to name if not provided)",
-                },
-                "namespace_id": {
-                    "type": "integer",
-                    "description": "ID of the namespace/group to create project in (optional)",
-                },
-                "description": {
-                    "type": "string",
-                    "description": "Project description (optional)",
-                },
-                "visibility": {
-                    "type": "string",
-                    "description": "Project visibility: 'private', 'internal', or 'public' (optional, default: private)",
-                },
-                "initialize_with_readme": {
-                    "type": "boolean",
-                    "description": "Initialize project with a README.md (optional, default: false)",
-                },
-            },
-        ),
-        (
-            "search_projects",
-            "Search for projects by name or description",
-            {
-                "search_term": {"type": "string", "description": DESC_SEARCH_QUERY},
-            },
-        ),
-        (
-            "list_project_members",
-            "List members of a project",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-            },
-        ),
-        (
-            "get_project_statistics",
-            "Get statistics for a project",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-            },
-        ),
-        (
-            "list_milestones",
-            "List milestones for a project",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "state": {
-                    "type": "string",
-                    "description": "Filter by state: active, closed, all (optional, default: active)",
-                },
-            },
-        ),
-        (
-            "get_milestone",
-            "Get details of a specific milestone",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "milestone_id": {"type": "integer", "description": "Milestone ID"},
-            },
-        ),
-        (
-            "create_milestone",
-            "Create a new milestone",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "title": {"type": "string", "description": "Milestone title"},
-                "description": {
-                    "type": "string",
-                    "description": "Milestone description (optional)",
-                },
-                "due_date": {
-                    "type": "string",
-                    "description": "Due date (YYYY-MM-DD format, optional)",
-                },
-                "start_date": {
-                    "type": "string",
-                    "description": "Start date (YYYY-MM-DD format, optional)",
-                },
-            },
-        ),
-        (
-            "update_milestone",
-            "Update an existing milestone",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "milestone_id": {"type": "integer", "description": "Milestone ID"},
-                "title": {"type": "string", "description": DESC_NEW_TITLE},
-                "description": {"type": "string", "description": DESC_NEW_DESC},
-                "due_date": {
-                    "type": "string",
-                    "description": "New due date (YYYY-MM-DD format, optional)",
-                },
-                "start_date": {
-                    "type": "string",
-                    "description": "New start date (YYYY-MM-DD format, optional)",
-                },
-                "state_event": {
-                    "type": "string",
-                    "description": "State event: close, activate (optional)",
-                },
-            },
-        ),
-        # Label tools (4)
-        (
-            "list_labels",
-            "List labels for a project",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-            },
-        ),
-        (
-            "create_label",
-            "Create a new label",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "name": {"type": "string", "description": "Label name"},
-                "color": {
-                    "type": "string",
-                    "description": "Label color (hex format, e.g., '#FF0000')",
-                },
-                "description": {"type": "string", "description": "Label description (optional)"},
-            },
-        ),
-        (
-            "update_label",
-            "Update an existing label",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "name": {"type": "string", "description": "Current label name"},
-                "new_name": {"type": "string", "description": "New label name (optional)"},
-                "color": {"type": "string", "description": "New color (hex format, optional)"},
-                "description": {"type": "string", "description": DESC_NEW_DESC},
-            },
-        ),
-        (
-            "delete_label",
-            "Delete a label",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "name": {"type": "string", "description": "Label name"},
-            },
-        ),
-        # Wiki tools (5)
-        (
-            "list_wiki_pages",
-            "List wiki pages for a project",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-            },
-        ),
-        (
-            "get_wiki_page",
-            "Get content of a specific wiki page",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "slug": {
-                    "type": "string",
-                    "description": DESC_WIKI_SLUG,
-                },
-            },
-        ),
-        (
-            "create_wiki_page",
-            "Create a new wiki page",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "title": {"type": "string", "description": "Page title"},
-                "content": {"type": "string", "description": "Page content (Markdown format)"},
-            },
-        ),
-        (
-            "update_wiki_page",
-            "Update an existing wiki page",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "slug": {
-                    "type": "string",
-                    "description": DESC_WIKI_SLUG,
-                },
-                "title": {"type": "string", "description": "New page title (optional)"},
-                "content": {"type": "string", "description": "New page content (optional)"},
-            },
-        ),
-        (
-            "delete_wiki_page",
-            "Delete a wiki page",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "slug": {
-                    "type": "string",
-                    "description": DESC_WIKI_SLUG,
-                },
-            },
-        ),
-        # Snippet tools (5)
-        (
-            "list_snippets",
-            "List snippets for a project",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-            },
-        ),
-        (
-            "get_snippet",
-            "Get content of a specific snippet",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "snippet_id": {"type": "integer", "description": DESC_SNIPPET_ID},
-            },
-        ),
-        (
-            "create_snippet",
-            "Create a new snippet",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "title": {"type": "string", "description": "Snippet title"},
-                "file_name": {"type": "string", "description": "File name"},
-                "content": {"type": "string", "description": "Snippet content"},
-                "visibility": {
-                    "type": "string",
-                    "description": "Visibility: private, internal, public (optional, default: private)",
-                },
-            },
-        ),
-        (
-            "update_snippet",
-            "Update an existing snippet",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "snippet_id": {"type": "integer", "description": DESC_SNIPPET_ID},
-                "title": {"type": "string", "description": DESC_NEW_TITLE},
-                "file_name": {"type": "string", "description": "New file name (optional)"},
-                "content": {"type": "string", "description": "New content (optional)"},
-                "visibility": {"type": "string", "description": "New visibility (optional)"},
-            },
-        ),
-        (
-            "delete_snippet",
-            "Delete a snippet",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "snippet_id": {"type": "integer", "description": DESC_SNIPPET_ID},
-            },
-        ),
-        # Release tools (5)
-        (
-            "list_releases",
-            "List releases for a project",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-            },
-        ),
-        (
-            "get_release",
-            "Get details of a specific release",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "tag_name": {
-                    "type": "string",
-                    "description": DESC_TAG_RELEASE,
-                },
-            },
-        ),
-        (
-            "create_release",
-            "Create a new release",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "tag_name": {"type": "string", "description": DESC_TAG_NAME},
-                "name": {"type": "string", "description": "Release name"},
-                "description": {"type": "string", "description": "Release description (optional)"},
-                "ref": {
-                    "type": "string",
-                    "description": "Commit SHA, branch, or tag (optional, default: default branch)",
-                },
-            },
-        ),
-        (
-            "update_release",
-            "Update an existing release",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "tag_name": {"type": "string", "description": DESC_TAG_NAME},
-                "name": {"type": "string", "description": "New release name (optional)"},
-                "description": {
-                    "type": "string",
-                    "description": "New release description (optional)",
-                },
-            },
-        ),
-        (
-            "delete_release",
-            "Delete a release",
-            {
-                "project_id": {
-                    "type": "string",
-                    "description": DESC_PROJECT_ID,
-                },
-                "tag_name": {"type": "string", "description": DESC_TAG_NAME},
-            },
-        ),
-        # User tools (3)
-        (
-            "get_user",
-            "Get details of a specific user",
-            {
-                "user_id": {"type": "integer", "description": "User ID"},
-            },
-        ),
-        (
-            "search_users",
-            "Search for users by username or email",
-            {
-                "search": {"type": "string", "description": DESC_SEARCH_QUERY},
-            },
-        ),
-        (
-            "list_user_projects",
-            "List projects for a specific user",
-            {
-                "user_id": {"type": "integer", "description": "User ID"},
-            },
-        ),
-        # Group tools (3)
-        (
-            "list_groups",
-            "List groups accessible by the user",
-            {
-                "owned": {"type": "boolean", "description": "Limit to owned groups (optional)"},
-                "per_page": {
-                    "type": "integer",
-                    "description": DESC_PER_PAGE,
-                },
-            },
-        ),
-        (
-            "get_group",
-            "Get details of a specific group",
-            {
-                "group_id": {"type": "string", "description": "Group ID or path"},
-            },
-        ),
-        (
-            "list_group_members",
-            "List members of a group",
-            {
-                "group_id": {"type": "string", "description": "Group ID or path"},
-            },
-        ),
-    ]
-
-
-def _get_meta_tool_definitions() -> list[tuple[str, str, dict[str, Any]]]:
+    return list(_TOOL_DEFINITIONS)
+
+
+# Slim-mode meta-tool schemas, built once at import like _TOOL_DEFINITIONS
+_META_TOOL_DEFINITIONS: tuple[ToolDefinition, ...] = (
+    ToolDefinition(
+        "discover_tools",
+        "Discover available GitLab tools by category. Returns tool names and descriptions. "
+        "Categories: context, repositories, issues, merge_requests, pipelines, projects, "
+        "labels, wikis, snippets, releases, users, groups",
+        {
+            "category": {
+                "type": "string",
+                "description": "Category to filter (optional). If omitted, returns all categories.",
+            },
+        },
+    ),
+    ToolDefinition(
+        "get_tool_schema",
+        "Get the full JSON schema for a specific GitLab tool. "
+        "Use after discover_tools to get parameter details before calling execute_tool.",
+        {
+            "tool_name": {
+                "type": "string",
+                "description": "Name of the tool to get schema for (e.g., 'list_merge_requests')",
+            },
+        },
+    ),
+    ToolDefinition(
+        "execute_tool",
+        "Execute any GitLab tool by name with the provided arguments. "
+        "Use after getting the schema to understand required parameters.",
+        {
+            "tool_name": {
+                "type": "string",
+                "description": "Name of the tool to execute (e.g., 'list_merge_requests')",
+            },
+            "arguments": {
+                "type": "object",
+                "description": "Tool-specific arguments (optional). See get_tool_schema for details.",
+            },
+        },
+    ),
+)
+
+
+def _get_meta_tool_definitions() -> list[ToolDefinition]:
     """
     Get meta-tool definitions for slim mode (3 tools instead of 87).
 
     These meta-tools enable lazy loading of the full tool set,
-    reducing context window usage by ~95%.
+    reducing context window usage by ~95%. The schema dicts are shared
+    module state and must not be mutated.
 
     Returns:
-        List of tuples: (name, description, input_schema)
+        List of ToolDefinition tuples: (name, description, params)
     """
-    return [
-        (
-            "discover_tools",
-            "Discover available GitLab tools by category. Returns tool names and descriptions. "
-            "Categories: context, repositories, issues, merge_requests, pipelines, projects, "
-            "labels, wikis, snippets, releases, users, groups",
-            {
-                "category": {
-                    "type": "string",
-                    "description": "Category to filter (optional). If omitted, returns all categories.",
-                },
-            },
-        ),
-        (
-            "get_tool_schema",
-            "Get the full JSON schema for a specific GitLab tool. "
-            "Use after discover_tools to get parameter details before calling execute_tool.",
-            {
-                "tool_name": {
-                    "type": "string",
-                    "description": "Name of the tool to get schema for (e.g., 'list_merge_requests')",
-                },
-            },
-        ),
-        (
-            "execute_tool",
-            "Execute any GitLab tool by name with the provided arguments. "
-            "Use after getting the schema to understand required parameters.",
-            {
-                "tool_name": {
-                    "type": "string",
-                    "description": "Name of the tool to execute (e.g., 'list_merge_requests')",
-                },
-                "arguments": {
-                    "type": "object",
-                    "description": "Tool-specific arguments (optional). See get_tool_schema for details.",
-                },
-            },
-        ),
-    ]
+    return list(_META_TOOL_DEFINITIONS)
 
 
 def _build_tool_schema(params_schema: dict[str, Any]) -> dict[str, Any]:
@@ -2416,105 +1979,140 @@ async def async_main(
         tool_defs = _get_tool_definitions()
         logger.info("Starting in FULL mode with %d tools", len(tool_defs))
 
+    # Encode responses compactly unless GITLAB_PRETTY_JSON is set
+    dumps_json = _select_json_dumps(config.pretty_json)
+
+    # Cache read-only tool results for GITLAB_CACHE_TTL seconds (0 disables)
+    tool_cache = ToolResultCache(ttl_seconds=config.cache_ttl) if config.cache_ttl else None
+
+    # Resolve each advertised tool's function once so calls are a single dict lookup
+    tool_functions: dict[str, Callable[..., Any]] = {
+        tool_def.name: getattr(tools, tool_def.name) for tool_def in tool_defs
+    }
+    tool_params = {tool_def.name: tuple(tool_def.params) for tool_def in tool_defs}
+
+    # The advertised tool list is static, so build the MCP Tool models once
+    # and serve the same list on every tools/list request
+    tool_list = [
+        Tool(
+            name=tool_def.name,
+            description=tool_def.description,
+            inputSchema=_build_tool_schema(tool_def.params),
+        )
+        for tool_def in tool_defs
+    ]
+
+    # Compile one input validator per tool up front. The SDK's built-in
+    # validation calls jsonschema.validate(), which re-checks the schema
+    # against the metaschema and builds a new validator on every call.
+    tool_validators = {
+        tool.name: validator_for(tool.inputSchema)(tool.inputSchema) for tool in tool_list
+    }
+
     # Register list_tools handler
     @server.list_tools()
     async def list_tools() -> list[Any]:
         """List all available GitLab tools."""
-        await asyncio.sleep(0)  # Allow event loop to process other tasks
-        from mcp.types import Tool
-
-        return [
-            Tool(
-                name=name,
-                description=description,
-                inputSchema=_build_tool_schema(params_schema),
-            )
-            for name, description, params_schema in tool_defs
-        ]
+        return tool_list
 
     # Register call_tool handler
-    @server.call_tool()
+    @server.call_tool(validate_input=False)
     async def call_tool(name: str, arguments: dict[str, Any]) -> list[Any]:
         """Execute a GitLab tool by name with the provided arguments."""
-        from mcp.types import TextContent
-
         # Route tool calls to appropriate functions
-        tool_func = getattr(tools, name, None)
+        tool_func = tool_functions.get(name)
         if tool_func is None:
             raise ValueError(f"Unknown tool: {name}")
 
+        # Reject invalid arguments with the same message the SDK would produce
+        error = best_match(tool_validators[name].iter_errors(arguments))
+        if error is not None:
+            raise ValueError(f"Input validation error: {error.message}")
+
         try:
-            # Call the tool function with client and arguments
-            result = await tool_func(client, **arguments)
+            # Call the tool function with client and arguments off the event loop
+            result = await _dispatch_tool(
+                tool_func, client, name, tool_params[name], arguments, tool_cache
+            )
 
             # Convert result to MCP response format
-            import json
-
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
+            return [TextContent(type="text", text=dumps_json(result))]
+        except _ToolArgumentError as e:
+            # Arguments the tool cannot accept are client errors; skip the costly traceback
+            logger.info("Tool '%s' rejected its arguments: %s", name, e)
         except Exception as e:
             # Log detailed error for debugging (not exposed to clients)
             logger.error("Tool '%s' execution failed: %s", name, e, exc_info=True)
-            # Return generic error message (no sensitive details)
-            return [TextContent(type="text", text=f"Error executing {name}: operation failed")]
+        # Return generic error message (no sensitive details)
+        return [TextContent(type="text", text=f"Error executing {name}: operation failed")]
 
     # Initialize registries for MCP protocol features
     resource_registry = ResourceRegistry()
     prompt_registry = PromptRegistry()
 
+    # Resources, templates and prompts are static, so build their MCP models once
+    resources_list = _build_resources_list(resource_registry)
+    resource_templates_list = _build_resource_templates_list(resource_registry)
+    prompts_list = _build_prompts_list(prompt_registry)
+
     # Register list_resources handler (MCP Resources feature)
     @server.list_resources()
     async def list_resources() -> list[Any]:
         """List all available GitLab resources."""
-        await asyncio.sleep(0)  # Allow event loop to process other tasks
-        return _build_resources_list(resource_registry)
+        return resources_list
 
     # Register list_resource_templates handler (MCP Resources feature)
     @server.list_resource_templates()
     async def list_resource_templates() -> list[Any]:
         """List all available GitLab resource templates."""
-        await asyncio.sleep(0)  # Allow event loop to process other tasks
-        return _build_resource_templates_list(resource_registry)
+        return resource_templates_list
 
     # Register read_resource handler (MCP Resources feature)
     @server.read_resource()
     async def read_resource(uri: str) -> Any:
         """Read a GitLab resource by URI."""
-        import json
-
-        from mcp.types import TextResourceContents
-        from pydantic import AnyUrl
-
         result = await read_resource_handler(uri, client)
-        content = json.dumps(result, indent=2) if isinstance(result, (dict, list)) else str(result)
+        content = dumps_json(result) if isinstance(result, (dict, list)) else str(result)
         return TextResourceContents(uri=AnyUrl(uri), mimeType="application/json", text=content)
 
     # Register list_prompts handler (MCP Prompts feature)
     @server.list_prompts()
     async def list_prompts() -> list[Any]:
         """List all available GitLab workflow prompts."""
-        await asyncio.sleep(0)  # Allow event loop to process other tasks
-        return _build_prompts_list(prompt_registry)
+        return prompts_list
+
+    # Prompt messages depend only on the prompt name and its arguments,
+    # so each combination is rendered once and reused
+    @functools.lru_cache(maxsize=512)
+    def render_prompt(name: str, args_key: tuple[tuple[str, str], ...]) -> Any:
+        return _build_prompt_messages(prompt_registry, name, dict(args_key))
 
     # Register get_prompt handler (MCP Prompts feature)
     @server.get_prompt()
     async def get_prompt(name: str, arguments: dict[str, str] | None = None) -> Any:
         """Get a GitLab workflow prompt with formatted messages."""
-        return _build_prompt_messages(prompt_registry, name, arguments or {})
+        return render_prompt(name, tuple(sorted((arguments or {}).items())))
 
     # Run the server with the selected transport
-    if transport == "stdio":
-        # Standard I/O transport for local CLI clients
-        async with stdio_server() as (read_stream, write_stream):
-            await server.run(read_stream, write_stream, server.create_initialization_options())
-    elif transport == "http":
-        # Streamable HTTP transport for remote clients
-        await _run_http_server(server, host, port)
+    await _TRANSPORTS[transport](server, host, port)
+
 
+class ServerArgs(NamedTuple):
+    """Command-line options for the GitLab MCP Server."""
+
+    transport: Literal["stdio", "http"] = "stdio"
+    host: str = "127.0.0.1"
+    port: int = 8000
+    mode: Literal["full", "slim"] = "full"
+
+
+@functools.cache
+def _get_arg_parser() -> "argparse.ArgumentParser":
+    """Build the CLI argument parser once and reuse it for every parse."""
+    import argparse
 
-def parse_args() -> argparse.Namespace:
-    """Parse command-line arguments for the GitLab MCP Server."""
     parser = argparse.ArgumentParser(
-        description="GitLab MCP Server - Model Context Protocol server for GitLab",
+        description=_SERVER_DESCRIPTION,
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
@@ -2532,28 +2130,72 @@ Examples:
     parser.add_argument(
         "--transport",
         choices=["stdio", "http"],
-        default="stdio",
         help="Transport protocol: stdio (default) for local clients, http for remote clients",
     )
     parser.add_argument(
         "--host",
-        default="127.0.0.1",
-        help="Host to bind HTTP server to (default: 127.0.0.1)",
+        help="Host to bind HTTP server to (default: %(default)s)",
     )
     parser.add_argument(
         "--port",
         type=int,
-        default=8000,
-        help="Port for HTTP server (default: 8000)",
+        help="Port for HTTP server (default: %(default)s)",
     )
     parser.add_argument(
         "--mode",
         choices=["full", "slim"],
-        default="full",
         help="Tool mode: full (87 tools) or slim (3 meta-tools for lazy loading)",
     )
+    # Defaults come from ServerArgs so flagless and flagged launches agree
+    parser.set_defaults(**ServerArgs()._asdict())
+
+    return parser
+
+
+def parse_args(argv: list[str] | None = None) -> ServerArgs:
+    """
+    Parse command-line arguments for the GitLab MCP Server.
+
+    The stdio server is usually launched without any flags, so argparse is
+    only imported and the parser only built when there is something to parse.
+
+    Args:
+        argv: Arguments to parse (default: sys.argv[1:])
+
+    Returns:
+        ServerArgs with the selected transport, host, port, and mode
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv:
+        return ServerArgs()
 
-    return parser.parse_args()
+    namespace = _get_arg_parser().parse_args(argv)
+    return ServerArgs(**vars(namespace))
+
+
+def _uvloop_run_kwargs() -> dict[str, Any]:
+    """
+    Select uvloop for asyncio.run() when it is installed.
+
+    uvloop is an optional speedup (``pip install python-gitlab-mcp[uvloop]``)
+    that benefits both transports, since every tool call goes out to the
+    GitLab API. Without it the default asyncio event loop is used.
+
+    Returns:
+        Extra keyword arguments for asyncio.run()
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return {}
+
+    if sys.version_info >= (3, 12):
+        return {"loop_factory": uvloop.new_event_loop}
+
+    # asyncio.run() has no loop_factory before 3.12; install the policy instead
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return {}
 
 
 def main() -> None:
@@ -2565,7 +2207,8 @@ def main() -> None:
             host=args.host,
             port=args.port,
             mode=args.mode,
-        )
+        ),
+        **_uvloop_run_kwargs(),
     )
 
 
@@ -10,6 +10,7 @@ reducing context window usage by ~95%. Clients can:
 This implements the lazy-mcp pattern for tool management.
 """
 
+import functools
 from typing import Any
 
 from gitlab_mcp.client.gitlab_client import GitLabClient
@@ -165,19 +166,26 @@ TOOL_CATEGORIES: dict[str, dict[str, Any]] = {
 }
 
 
+# Tool name -> category, built once so lookups do not scan every category
+_TOOL_CATEGORY_INDEX: dict[str, str] = {
+    tool_name: cat_name
+    for cat_name, cat_info in TOOL_CATEGORIES.items()
+    for tool_name in cat_info["tools"]
+}
+
+
 def _get_all_tool_names() -> list[str]:
     """Get all tool names across all categories."""
-    tools = []
-    for category in TOOL_CATEGORIES.values():
-        tools.extend(category["tools"])
-    return tools
+    return list(_TOOL_CATEGORY_INDEX)
 
 
+@functools.cache
 def _get_tool_definitions_map() -> dict[str, tuple[str, dict[str, Any]]]:
     """
     Get a map of tool name to (description, schema) from server's tool definitions.
 
     This lazily imports and caches the tool definitions from the server module.
+    The returned map is shared and must not be mutated.
     """
     # Import here to avoid circular dependency
     from gitlab_mcp.server import _get_tool_definitions
@@ -278,12 +286,7 @@ async def get_tool_schema(
         - category: Which category this tool belongs to
     """
     # Find which category this tool belongs to
-    tool_category = None
-    for cat_name, cat_info in TOOL_CATEGORIES.items():
-        if tool_name in cat_info["tools"]:
-            tool_category = cat_name
-            break
-
+    tool_category = _TOOL_CATEGORY_INDEX.get(tool_name)
     if tool_category is None:
         all_tools = _get_all_tool_names()
         return {
@@ -302,21 +305,11 @@ async def get_tool_schema(
 
     description, params_schema = tool_defs[tool_name]
 
-    # Build the full input schema (same logic as server._build_tool_schema)
-    input_schema: dict[str, Any] = {
-        "type": "object",
-        "properties": {},
-    }
-
-    required = []
-    for param_name, param_def in params_schema.items():
-        input_schema["properties"][param_name] = param_def
-        # Parameters without "optional" in description are required
-        if "optional" not in param_def.get("description", "").lower():
-            required.append(param_name)
+    # Import here to avoid circular dependency. The builder copies each
+    # parameter definition, so the shared server schemas are never exposed.
+    from gitlab_mcp.server import _build_tool_schema
 
-    if required:
-        input_schema["required"] = required
+    input_schema = _build_tool_schema(params_schema)
 
     return {
         "name": tool_name,
@@ -346,8 +339,7 @@ async def execute_tool(
         The result from the executed tool
     """
     # Validate tool exists
-    all_tools = _get_all_tool_names()
-    if tool_name not in all_tools:
+    if tool_name not in _TOOL_CATEGORY_INDEX:
         return {
             "error": f"Unknown tool: {tool_name}",
             "hint": "Use discover_tools() to see available tools",
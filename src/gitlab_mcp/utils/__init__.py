@@ -1,8 +1,9 @@
 """Utility modules for GitLab MCP Server.
 
-This package provides common utilities like logging, formatting, and helpers.
+This package provides common utilities like logging, caching, and helpers.
 """
 
+from gitlab_mcp.utils.cache import ToolResultCache
 from gitlab_mcp.utils.logging import redact_sensitive_data, setup_logger
 
-__all__ = ["setup_logger", "redact_sensitive_data"]
+__all__ = ["setup_logger", "redact_sensitive_data", "ToolResultCache"]
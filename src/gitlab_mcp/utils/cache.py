@@ -0,0 +1,160 @@
+"""Response cache for read-only tool calls.
+
+This module provides:
+- A bounded LRU cache with per-entry expiry (TTL)
+- Keys built from the tool name and its argument values in parameter order
+- Full invalidation after mutating tool calls
+- Tracking of in-flight calls so concurrent identical calls share one result
+
+The cache is used from the event loop thread only, so it does no locking.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+# Default cache bounds
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_TTL_SECONDS = 30.0
+
+# Placeholder for parameters omitted from a call, distinct from an explicit None
+_MISSING = object()
+
+
+class ToolResultCache:
+    """LRU + TTL cache of tool results keyed by tool name and arguments.
+
+    Results whose arguments cannot be hashed (e.g. nested lists) are simply
+    not cached.
+
+    Attributes:
+        max_entries: Maximum number of cached results before LRU eviction
+        ttl_seconds: Seconds a cached result stays valid
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached results (default: 512)
+            ttl_seconds: Seconds a cached result stays valid (default: 30)
+            clock: Monotonic time source, overridable for tests
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        # key -> (expires_at, result)
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        # key -> future of a call that has started but not yet finished
+        self.inflight: dict[Hashable, asyncio.Future[Any]] = {}
+        # Bumped on every invalidation so calls that overlap one skip caching
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every invalidation; pass its value at call start to set()."""
+        return self._generation
+
+    def __len__(self) -> int:
+        """Return the number of cached results, including expired ones not yet evicted."""
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(
+        name: str, param_names: tuple[str, ...], arguments: dict[str, Any]
+    ) -> Hashable | None:
+        """Build a cache key for a tool call.
+
+        The key is a flat tuple of argument values in the tool's parameter
+        order, so no per-call set of items is built. List values (e.g.
+        labels) are converted to tuples, keeping their order.
+
+        Args:
+            name: Tool name
+            param_names: The tool's parameter names, in schema order
+            arguments: Tool arguments
+
+        Returns:
+            Hashable key, or None if the arguments include unknown parameters
+            or values that cannot be hashed
+        """
+        values: list[Any] = []
+        present = 0
+        for param in param_names:
+            value = arguments.get(param, _MISSING)
+            if value is not _MISSING:
+                present += 1
+                if isinstance(value, list):
+                    value = tuple(value)
+            values.append(value)
+        if present != len(arguments):
+            return None
+        key = (name, tuple(values))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """Look up a cached result.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Tuple of (hit, result). result is None on a miss.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, result = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, result
+
+    def set(self, key: Hashable, result: Any, generation: int | None = None) -> None:
+        """Store a tool result, evicting the least recently used entry if full.
+
+        A result whose call overlapped an invalidation may predate the
+        mutation that caused it, so it is dropped instead of stored.
+
+        Args:
+            key: Key from make_key()
+            result: Tool result to cache
+            generation: Value of generation when the call started, or None to
+                store unconditionally
+        """
+        if generation is not None and generation != self._generation:
+            return
+        self._entries[key] = (self._clock() + self.ttl_seconds, result)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop every cached result after a mutating tool call.
+
+        A project can be named by numeric ID or by path, and some cached
+        results (e.g. project or user listings) span projects, so a write
+        cannot be matched to the entries it affects. Writes are rare next to
+        reads, so the whole cache is cleared. In-flight calls are forgotten
+        too, so callers arriving after the write do not join a read that
+        started before it.
+        """
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        self._generation += 1
+        self._entries.clear()
+        self.inflight.clear()
@@ -107,9 +107,9 @@ class TestServerToolRegistration:
         server.register_tool("test_tool", "A test tool", dummy_tool)
 
         assert "test_tool" in server._tools
-        assert server._tools["test_tool"]["name"] == "test_tool"
-        assert server._tools["test_tool"]["description"] == "A test tool"
-        assert server._tools["test_tool"]["function"] == dummy_tool
+        assert server._tools["test_tool"].name == "test_tool"
+        assert server._tools["test_tool"].description == "A test tool"
+        assert server._tools["test_tool"].function == dummy_tool
 
     def test_register_all_tools_creates_67_tools(self, server):
         """Test that register_all_tools creates all 88 tools."""
@@ -126,6 +126,6 @@ class TestServerToolRegistration:
         server.register_tool("test_tool", "A test tool", dummy_tool)
 
         # Tool function should be callable
-        tool_func = server._tools["test_tool"]["function"]
+        tool_func = server._tools["test_tool"].function
         result = await tool_func()
         assert result == {"result": "success"}
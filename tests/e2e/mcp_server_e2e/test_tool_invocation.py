@@ -101,7 +101,7 @@ class TestToolInvocation:
 
         # Verify the tool function is callable
         tool_info = server._tools["get_user"]
-        assert callable(tool_info["function"])
+        assert callable(tool_info.function)
 
 
 @pytest.mark.e2e
@@ -19,7 +19,7 @@ from gitlab_mcp.client.exceptions import (
     PermissionError,
     RateLimitError,
 )
-from gitlab_mcp.client.gitlab_client import GitLabClient
+from gitlab_mcp.client.gitlab_client import GitLabClient, _tail_job_log
 from gitlab_mcp.config.settings import GitLabConfig
 
 
@@ -82,6 +82,25 @@ class TestGitLabClientAuthentication:
         # Verify client is connected
         assert client._gitlab is not None
 
+    @patch("gitlab_mcp.client.gitlab_client.Gitlab")
+    def test_authenticate_sizes_connection_pool(self, mock_gitlab_class):
+        """Test that the HTTP session keeps enough connections for concurrent tool calls."""
+        from gitlab_mcp.client.gitlab_client import HTTP_POOL_MAXSIZE
+
+        config = GitLabConfig(
+            gitlab_url="https://gitlab.example.com",
+            gitlab_token="test-token-123",
+        )
+        mock_gitlab_instance = Mock()
+        mock_gitlab_class.return_value = mock_gitlab_instance
+
+        client = GitLabClient(config)
+        client.authenticate()
+
+        mounted = dict(call.args for call in mock_gitlab_instance.session.mount.call_args_list)
+        assert set(mounted) == {"https://", "http://"}
+        assert mounted["https://"]._pool_maxsize == HTTP_POOL_MAXSIZE
+
     @patch("gitlab_mcp.client.gitlab_client.Gitlab")
     def test_authenticate_invalid_token(self, mock_gitlab_class):
         """Test that invalid token raises AuthenticationError."""
@@ -8043,6 +8062,50 @@ class TestGitLabClientGetJobTrace:
         assert result["trace"] == "Building project...\nTests passed!\n"
         assert result["job_id"] == 1
 
+    @patch("gitlab_mcp.client.gitlab_client.Gitlab")
+    def test_get_job_trace_tail_lines(self, mock_gitlab_class):
+        """Test get_job_trace returns only the last tail_lines lines with counts."""
+        config = GitLabConfig(
+            gitlab_url="https://gitlab.example.com",
+            gitlab_token="test-token-123",
+        )
+
+        mock_job = Mock()
+        mock_job.trace.return_value = b"line 1\nline 2\nline 3\nline 4\n"
+
+        mock_project = Mock()
+        mock_project.jobs.get.return_value = mock_job
+
+        mock_gitlab_instance = Mock()
+        mock_gitlab_instance.projects.get.return_value = mock_project
+        mock_gitlab_class.return_value = mock_gitlab_instance
+
+        client = GitLabClient(config)
+        client._ensure_authenticated = Mock()
+        client._gitlab = mock_gitlab_instance
+
+        result = client.get_job_trace(project_id=123, job_id=1, tail_lines=2)
+
+        assert result["trace"] == "line 3\nline 4\n"
+        assert result["truncated"] is True
+        assert result["total_lines"] == 4
+        assert result["returned_lines"] == 2
+
+    @pytest.mark.parametrize(
+        ("raw", "tail_lines", "expected"),
+        [
+            (b"", None, (b"", 0, 0)),
+            (b"a\nb\nc", None, (b"a\nb\nc", 3, 3)),
+            (b"a\nb\nc", 2, (b"b\nc", 3, 2)),
+            (b"a\nb\nc\n", 1, (b"c\n", 3, 1)),
+            (b"a\nb\n", 5, (b"a\nb\n", 2, 2)),
+            (b"a\nb\n", 0, (b"a\nb\n", 2, 2)),
+        ],
+    )
+    def test_tail_job_log(self, raw, tail_lines, expected):
+        """Test counting and tailing raw job logs without splitting them."""
+        assert _tail_job_log(raw, tail_lines) == expected
+
     @patch("gitlab_mcp.client.gitlab_client.Gitlab")
     def test_get_job_trace_bytes_handling(self, mock_gitlab_class):
         """Test get_job_trace handles bytes properly."""
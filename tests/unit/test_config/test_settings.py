@@ -254,6 +254,24 @@ class TestLoadConfigFromEnv:
         assert config.log_level == "DEBUG"
         assert config.verify_ssl is False
 
+    def test_load_config_cache_ttl_from_env(self, monkeypatch):
+        """GITLAB_CACHE_TTL should set the tool result cache TTL."""
+        monkeypatch.setenv("GITLAB_URL", "https://gitlab.example.com")
+        monkeypatch.setenv("GITLAB_TOKEN", "glpat-env-token")
+        monkeypatch.setenv("GITLAB_CACHE_TTL", "0")
+
+        config = load_config()
+        assert config.cache_ttl == 0
+
+    def test_load_config_pretty_json_from_env(self, monkeypatch):
+        """GITLAB_PRETTY_JSON should enable indented JSON responses."""
+        monkeypatch.setenv("GITLAB_URL", "https://gitlab.example.com")
+        monkeypatch.setenv("GITLAB_TOKEN", "glpat-env-token")
+        monkeypatch.setenv("GITLAB_PRETTY_JSON", "true")
+
+        config = load_config()
+        assert config.pretty_json is True
+
     def test_load_config_missing_required_env_raises_error(self, monkeypatch):
         """Missing required env vars should raise ValidationError."""
         # Clear any existing env vars
@@ -238,6 +238,11 @@ class TestGetToolIconFunction:
         icon = get_tool_icon("")
         assert icon is None
 
+    def test_get_tool_icon_mixed_case_name(self):
+        """Mixed-case tool names should match the same category as lowercase."""
+        icon = get_tool_icon("List_Pipelines")
+        assert icon == get_tool_icon("list_pipelines")
+
 
 class TestIconCoverage:
     """Test that common tools have icons assigned."""
@@ -11,7 +11,7 @@ import pytest
 
 from gitlab_mcp.client.exceptions import AuthenticationError, NetworkError
 from gitlab_mcp.config.settings import GitLabConfig
-from gitlab_mcp.server import GitLabMCPServer
+from gitlab_mcp.server import GitLabMCPServer, ToolEntry
 
 
 class TestGitLabMCPServerInitialization:
@@ -53,6 +53,19 @@ class TestGitLabMCPServerInitialization:
         assert hasattr(server, "gitlab_client")
         assert server.gitlab_client is not None
 
+    def test_server_uses_slots(self) -> None:
+        """Test that server instances have no per-instance __dict__."""
+        config = GitLabConfig(
+            gitlab_url="https://gitlab.example.com",
+            gitlab_token="test-token-123",
+        )
+
+        server = GitLabMCPServer(config)
+
+        assert not hasattr(server, "__dict__")
+        with pytest.raises(AttributeError):
+            server.unknown_attribute = True  # type: ignore[attr-defined]
+
 
 class TestGitLabMCPServerLifecycle:
     """Test MCP server startup and shutdown."""
@@ -74,6 +87,45 @@ class TestGitLabMCPServerLifecycle:
 
             mock_auth.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_server_startup_authenticates_off_event_loop(self) -> None:
+        """Test that the blocking authentication call runs in a worker thread."""
+        import threading
+
+        config = GitLabConfig(
+            gitlab_url="https://gitlab.example.com",
+            gitlab_token="test-token-123",
+        )
+        server = GitLabMCPServer(config)
+        auth_threads: list[threading.Thread] = []
+
+        with patch.object(
+            server.gitlab_client,
+            "authenticate",
+            side_effect=lambda: auth_threads.append(threading.current_thread()),
+        ):
+            await server.startup()
+
+        assert auth_threads
+        assert auth_threads[0] is not threading.current_thread()
+
+    @pytest.mark.asyncio
+    async def test_server_startup_warms_tool_list(self) -> None:
+        """Test that startup builds the list_tools response ahead of the first call."""
+        config = GitLabConfig(
+            gitlab_url="https://gitlab.example.com",
+            gitlab_token="test-token-123",
+        )
+        server = GitLabMCPServer(config)
+        server.register_all_tools()
+
+        with patch.object(server.gitlab_client, "authenticate"):
+            await server.startup()
+
+        warmed = server._tool_list
+        assert warmed is not None
+        assert await server.list_tools() is warmed
+
     @pytest.mark.asyncio
     async def test_server_startup_handles_connection_error(self) -> None:
         """Test that server handles connection errors gracefully during startup."""
@@ -181,6 +233,51 @@ class TestGitLabMCPServerToolRegistration:
         assert tools[0]["name"] == "test_tool"
         assert tools[0]["description"] == "A test tool"
 
+    def test_register_tool_stores_frozen_tool_entry(self) -> None:
+        """Test that tools are stored as immutable, slotted ToolEntry records."""
+        config = GitLabConfig(
+            gitlab_url="https://gitlab.example.com",
+            gitlab_token="test-token-123",
+        )
+        server = GitLabMCPServer(config)
+
+        async def mock_tool() -> str:
+            return "ok"
+
+        server.register_tool(name="test_tool", description="A test tool", function=mock_tool)
+
+        entry = server._tools["test_tool"]
+        assert entry == ToolEntry("test_tool", "A test tool", mock_tool, True)
+        assert not hasattr(entry, "__dict__")
+        with pytest.raises(AttributeError):
+            entry.description = "changed"  # type: ignore[misc]
+
+    @pytest.mark.asyncio
+    async def test_list_tools_is_cached_until_next_registration(self) -> None:
+        """Test that list_tools reuses its result until another tool is registered."""
+        config = GitLabConfig(
+            gitlab_url="https://gitlab.example.com",
+            gitlab_token="test-token-123",
+        )
+        server = GitLabMCPServer(config)
+
+        async def mock_tool() -> str:
+            """Mock tool for testing."""
+            return "ok"
+
+        server.register_tool(name="first_tool", description="First", function=mock_tool)
+        first = await server.list_tools()
+        assert await server.list_tools() is first
+
+        server.register_tool(name="first_tool", description="Updated", function=mock_tool)
+        server.register_tool(name="second_tool", description="Second", function=mock_tool)
+        tools = await server.list_tools()
+
+        assert tools == [
+            {"name": "first_tool", "description": "Updated"},
+            {"name": "second_tool", "description": "Second"},
+        ]
+
 
 class TestGitLabMCPServerToolExecution:
     """Test MCP tool execution."""
@@ -217,6 +314,51 @@ class TestGitLabMCPServerToolExecution:
 
         assert result == "Result: test_value"
 
+    @pytest.mark.asyncio
+    async def test_call_tool_runs_sync_tool_in_thread(self) -> None:
+        """Test that call_tool runs synchronous tools off the event loop thread."""
+        import threading
+
+        config = GitLabConfig(
+            gitlab_url="https://gitlab.example.com",
+            gitlab_token="test-token-123",
+        )
+        server = GitLabMCPServer(config)
+
+        def sync_tool(param: str) -> dict[str, str]:
+            """Synchronous mock tool for testing."""
+            return {"param": param, "thread": threading.current_thread().name}
+
+        server.register_tool(name="sync_tool", description="A sync tool", function=sync_tool)
+
+        result = await server.call_tool("sync_tool", {"param": "value"})
+
+        assert result["param"] == "value"
+        assert result["thread"] != threading.current_thread().name
+
+    @pytest.mark.asyncio
+    async def test_call_tool_awaits_coroutine_returned_by_wrapper(self) -> None:
+        """Test that a sync wrapper returning a coroutine still has its result awaited."""
+        config = GitLabConfig(
+            gitlab_url="https://gitlab.example.com",
+            gitlab_token="test-token-123",
+        )
+        server = GitLabMCPServer(config)
+
+        async def mock_tool(param: str) -> str:
+            """Mock tool for testing."""
+            return f"Result: {param}"
+
+        server.register_tool(
+            name="wrapped_tool",
+            description="A wrapped tool",
+            function=lambda **kwargs: mock_tool(**kwargs),
+        )
+
+        result = await server.call_tool("wrapped_tool", {"param": "test_value"})
+
+        assert result == "Result: test_value"
+
     @pytest.mark.asyncio
     async def test_call_tool_raises_error_for_unknown_tool(self) -> None:
         """Test that call_tool raises error for unknown tool."""
@@ -258,3 +400,16 @@ class TestGitLabMCPServerInfo:
         assert info["name"] == "test-server"
         assert "version" in info
         assert "description" in info
+
+    def test_get_info_returns_independent_copies(self) -> None:
+        """Test that mutating one get_info result does not affect later calls."""
+        config = GitLabConfig(
+            gitlab_url="https://gitlab.example.com",
+            gitlab_token="test-token-123",
+        )
+        server = GitLabMCPServer(config)
+
+        info = server.get_info()
+        info["version"] = "changed"
+
+        assert server.get_info()["version"] == "0.1.0"
@@ -5,11 +5,31 @@ Tests the async_main(), main(), and _get_tool_definitions() functions.
 Following TDD: These tests are written FIRST (RED phase).
 """
 
+import asyncio
+import json
+import sys
+from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from gitlab_mcp.server import _build_tool_schema, _get_tool_definitions, main
+from gitlab_mcp.server import (
+    _CACHEABLE_TOOLS,
+    _TRANSPORTS,
+    DESC_PROJECT_ID,
+    ServerArgs,
+    ToolDefinition,
+    _build_prompt_arguments,
+    _build_prompts_list,
+    _build_tool_schema,
+    _get_arg_parser,
+    _get_meta_tool_definitions,
+    _get_tool_definitions,
+    _select_json_dumps,
+    _uvloop_run_kwargs,
+    main,
+    parse_args,
+)
 
 
 class TestToolDefinitions:
@@ -27,6 +47,37 @@ class TestToolDefinitions:
 
         assert len(tool_defs) == 88
 
+    def test_get_tool_definitions_reuses_schemas(self) -> None:
+        """Test that repeated calls share the static schemas but not the list."""
+        first = _get_tool_definitions()
+        second = _get_tool_definitions()
+
+        assert first is not second
+        assert all(a[2] is b[2] for a, b in zip(first, second, strict=True))
+
+    def test_get_meta_tool_definitions_reuses_schemas(self) -> None:
+        """Test that slim-mode meta-tool definitions are built once and shared."""
+        first = _get_meta_tool_definitions()
+        second = _get_meta_tool_definitions()
+
+        assert first is not second
+        assert [name for name, _, _ in first] == [
+            "discover_tools",
+            "get_tool_schema",
+            "execute_tool",
+        ]
+        assert all(a[2] is b[2] for a, b in zip(first, second, strict=True))
+
+    def test_common_params_share_one_spec(self) -> None:
+        """Test that repeated parameter specs are shared rather than duplicated."""
+        project_id_specs = {
+            id(params["project_id"])
+            for _name, _description, params in _get_tool_definitions()
+            if params.get("project_id", {}).get("description") == DESC_PROJECT_ID
+        }
+
+        assert len(project_id_specs) == 1
+
     def test_tool_definition_structure(self) -> None:
         """Test that each tool definition has correct structure."""
         tool_defs = _get_tool_definitions()
@@ -41,6 +92,12 @@ class TestToolDefinitions:
             assert isinstance(description, str)
             assert isinstance(params_schema, dict)
 
+    def test_tool_definitions_have_named_fields(self) -> None:
+        """Test that tool definitions expose their fields by name."""
+        for tool_def in _get_tool_definitions() + _get_meta_tool_definitions():
+            assert isinstance(tool_def, ToolDefinition)
+            assert tool_def == (tool_def.name, tool_def.description, tool_def.params)
+
     def test_tool_names_are_unique(self) -> None:
         """Test that all tool names are unique."""
         tool_defs = _get_tool_definitions()
@@ -270,6 +327,109 @@ class TestMainEntryPoint:
         assert len(call_args) == 1
 
 
+class TestUvloopSelection:
+    """Test optional uvloop selection for main()."""
+
+    def test_without_uvloop_uses_default_loop(self) -> None:
+        """Test that no extra asyncio.run() arguments are used without uvloop."""
+        with patch.dict(sys.modules, {"uvloop": None}):
+            assert _uvloop_run_kwargs() == {}
+
+    @patch("gitlab_mcp.server.asyncio.set_event_loop_policy")
+    def test_with_uvloop_selects_uvloop(self, mock_set_policy: Mock) -> None:
+        """Test that uvloop is used when it is installed."""
+        fake_uvloop = Mock()
+        with patch.dict(sys.modules, {"uvloop": fake_uvloop}):
+            kwargs = _uvloop_run_kwargs()
+
+        if sys.version_info >= (3, 12):
+            assert kwargs == {"loop_factory": fake_uvloop.new_event_loop}
+            mock_set_policy.assert_not_called()
+        else:
+            assert kwargs == {}
+            mock_set_policy.assert_called_once_with(fake_uvloop.EventLoopPolicy.return_value)
+
+
+class TestJsonEncoderSelection:
+    """Test JSON encoder selection for tool responses."""
+
+    def test_without_orjson_uses_stdlib_json(self) -> None:
+        """Test that responses are encoded with json.dumps when orjson is missing."""
+        value = {"id": 1, "name": "é"}
+        with patch.dict(sys.modules, {"orjson": None}):
+            compact = _select_json_dumps()
+            pretty = _select_json_dumps(pretty=True)
+
+        assert compact(value) == '{"id":1,"name":"é"}'
+        assert pretty(value) == json.dumps(value, indent=2, ensure_ascii=False)
+
+    def test_output_is_compact_by_default(self) -> None:
+        """Test that the default encoder emits compact JSON that round-trips."""
+        value = {"id": 1, "labels": ["bug"], "author": {"name": "Test"}, "closed": None}
+
+        text = _select_json_dumps()(value)
+
+        assert json.loads(text) == value
+        assert text.startswith('{"id":1,"labels":["bug"]')
+
+    def test_pretty_output_is_indented(self) -> None:
+        """Test that pretty output is indented by two spaces."""
+        value = {"id": 1, "labels": ["bug"], "author": {"name": "Test"}, "closed": None}
+
+        text = _select_json_dumps(pretty=True)(value)
+
+        assert json.loads(text) == value
+        assert '\n  "id": 1' in text
+
+    def test_falls_back_for_values_orjson_rejects(self) -> None:
+        """Test that non-string dict keys are still encoded."""
+        assert json.loads(_select_json_dumps()({1: "a"})) == {"1": "a"}
+
+
+class TestParseArgs:
+    """Test parse_args() CLI argument parsing."""
+
+    def test_parse_args_no_flags_returns_defaults(self) -> None:
+        """Test that an empty argv returns defaults without parsing."""
+        args = parse_args([])
+
+        assert args == ServerArgs()
+        assert args.transport == "stdio"
+        assert args.host == "127.0.0.1"
+        assert args.port == 8000
+        assert args.mode == "full"
+
+    def test_flagged_parse_uses_server_args_defaults(self) -> None:
+        """Test that unset flags fall back to the same defaults as a flagless launch."""
+        assert parse_args(["--mode", "full"]) == ServerArgs()
+        assert parse_args(["--port", "9000"]) == ServerArgs(port=9000)
+        assert "(default: 127.0.0.1)" in _get_arg_parser().format_help()
+
+    def test_parse_args_with_flags(self) -> None:
+        """Test that CLI flags are parsed into ServerArgs."""
+        args = parse_args(
+            ["--transport", "http", "--host", "0.0.0.0", "--port", "9000", "--mode", "slim"]
+        )
+
+        assert args == ServerArgs(transport="http", host="0.0.0.0", port=9000, mode="slim")
+
+    def test_parser_is_built_once(self) -> None:
+        """Test that repeated parses reuse the same parser instance."""
+        parse_args(["--port", "9001"])
+        parse_args(["--port", "9002"])
+
+        assert _get_arg_parser() is _get_arg_parser()
+        assert _get_arg_parser.cache_info().currsize == 1
+
+    def test_every_transport_choice_has_a_runner(self) -> None:
+        """Test that each --transport choice maps to a transport runner."""
+        transport_action = next(
+            action for action in _get_arg_parser()._actions if action.dest == "transport"
+        )
+
+        assert set(transport_action.choices) == set(_TRANSPORTS)
+
+
 class TestAsyncMainEntryPoint:
     """Test async_main() entry point."""
 
@@ -403,6 +563,449 @@ class TestAsyncMainEntryPoint:
         assert exc_info.value.code == 1
 
 
+async def _capture_async_main_handlers(mode: str = "full") -> dict[str, Any]:
+    """Run async_main against mocks and return the MCP handlers it registered."""
+    from gitlab_mcp.config.settings import GitLabConfig
+    from gitlab_mcp.server import async_main
+
+    handlers: dict[str, Any] = {}
+
+    def capture(handler_name: str) -> Mock:
+        def decorator(func: Any) -> Any:
+            handlers[handler_name] = func
+            return func
+
+        return Mock(return_value=decorator)
+
+    mock_server_instance = Mock()
+    for handler_name in (
+        "list_tools",
+        "call_tool",
+        "list_resources",
+        "list_resource_templates",
+        "read_resource",
+        "list_prompts",
+        "get_prompt",
+    ):
+        setattr(mock_server_instance, handler_name, capture(handler_name))
+    mock_server_instance.run = AsyncMock()
+    mock_server_instance.create_initialization_options = Mock(return_value={})
+
+    mock_stdio_instance = AsyncMock()
+    mock_stdio_instance.__aenter__ = AsyncMock(return_value=(Mock(), Mock()))
+    mock_stdio_instance.__aexit__ = AsyncMock(return_value=None)
+
+    mock_client_instance = Mock()
+    handlers["client"] = mock_client_instance
+
+    with (
+        patch(
+            "gitlab_mcp.server.load_config",
+            return_value=GitLabConfig(
+                gitlab_url="https://gitlab.example.com", gitlab_token="test-token"
+            ),
+        ),
+        patch("gitlab_mcp.server.GitLabClient", return_value=mock_client_instance),
+        patch("gitlab_mcp.server.Server", return_value=mock_server_instance),
+        patch("gitlab_mcp.server.stdio_server", return_value=mock_stdio_instance),
+    ):
+        await async_main(mode=mode)  # type: ignore[arg-type]
+
+    return handlers
+
+
+class TestAsyncMainListToolsHandler:
+    """Test the list_tools handler registered by async_main()."""
+
+    @pytest.mark.asyncio
+    async def test_list_tools_returns_all_tools(self) -> None:
+        """Test that every tool definition is advertised with its schema."""
+        handlers = await _capture_async_main_handlers()
+
+        listed = await handlers["list_tools"]()
+
+        assert [t.name for t in listed] == [name for name, _, _ in _get_tool_definitions()]
+        assert all(t.inputSchema["type"] == "object" for t in listed)
+
+    @pytest.mark.asyncio
+    async def test_list_tools_reuses_built_models(self) -> None:
+        """Test that repeated tools/list requests return the same prebuilt list."""
+        handlers = await _capture_async_main_handlers(mode="slim")
+
+        first = await handlers["list_tools"]()
+        second = await handlers["list_tools"]()
+
+        assert first is second
+        assert [t.name for t in first] == ["discover_tools", "get_tool_schema", "execute_tool"]
+
+
+class TestAsyncMainResourceHandlers:
+    """Test the resource and prompt list handlers registered by async_main()."""
+
+    @pytest.mark.asyncio
+    async def test_list_resources_reuses_built_models(self) -> None:
+        """Test that resources and templates are built once and served on every request."""
+        handlers = await _capture_async_main_handlers()
+
+        resources = await handlers["list_resources"]()
+        templates = await handlers["list_resource_templates"]()
+
+        assert resources is await handlers["list_resources"]()
+        assert templates is await handlers["list_resource_templates"]()
+        assert "gitlab://projects" in {str(r.uri) for r in resources}
+        assert "gitlab://project/{project_id}" in {t.uriTemplate for t in templates}
+
+    @pytest.mark.asyncio
+    async def test_get_prompt_reuses_rendered_messages(self) -> None:
+        """Test that identical prompt requests are rendered once."""
+        handlers = await _capture_async_main_handlers()
+        get_prompt = handlers["get_prompt"]
+
+        first = await get_prompt(
+            "create-mr-from-issue", {"project_id": "group/project", "issue_iid": "1"}
+        )
+        again = await get_prompt(
+            "create-mr-from-issue", {"issue_iid": "1", "project_id": "group/project"}
+        )
+        other = await get_prompt(
+            "create-mr-from-issue", {"project_id": "group/project", "issue_iid": "2"}
+        )
+
+        assert again is first
+        assert other is not first
+        assert "group/project" in first.messages[0].content.text
+
+    @pytest.mark.asyncio
+    async def test_get_prompt_errors_are_not_cached(self) -> None:
+        """Test that invalid prompt requests still raise every time."""
+        handlers = await _capture_async_main_handlers()
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Unknown prompt"):
+                await handlers["get_prompt"]("no-such-prompt", None)
+
+    @pytest.mark.asyncio
+    async def test_list_prompts_reuses_built_models(self) -> None:
+        """Test that the prompt list is built once and served on every request."""
+        handlers = await _capture_async_main_handlers()
+
+        prompts = await handlers["list_prompts"]()
+
+        assert prompts is await handlers["list_prompts"]()
+        assert len(prompts) > 0
+
+
+class TestAsyncMainCallToolHandler:
+    """Test the call_tool handler registered by async_main()."""
+
+    @pytest.mark.asyncio
+    async def test_call_tool_dispatches_advertised_tool(self) -> None:
+        """Test that an advertised tool is called with the client and arguments."""
+        with patch(
+            "gitlab_mcp.tools.get_project", new=AsyncMock(return_value={"id": 1})
+        ) as mock_tool:
+            handlers = await _capture_async_main_handlers()
+            result = await handlers["call_tool"]("get_project", {"project_id": "group/project"})
+
+        mock_tool.assert_awaited_once_with(handlers["client"], project_id="group/project")
+        assert json.loads(result[0].text) == {"id": 1}
+
+    @pytest.mark.asyncio
+    async def test_call_tool_runs_off_event_loop_thread(self) -> None:
+        """Test that blocking tool bodies run on the tool worker pool."""
+        import threading
+
+        async def fake_get_project(client: Any, project_id: str) -> dict[str, str]:
+            return {"thread": threading.current_thread().name}
+
+        with patch("gitlab_mcp.tools.get_project", new=fake_get_project):
+            handlers = await _capture_async_main_handlers()
+            result = await handlers["call_tool"]("get_project", {"project_id": "group/project"})
+
+        assert json.loads(result[0].text)["thread"].startswith("gitlab-mcp-tool")
+
+    @pytest.mark.asyncio
+    async def test_call_tool_caches_read_only_results(self) -> None:
+        """Test that repeated read-only calls are served from the cache until a mutation."""
+        get_project = AsyncMock(return_value={"id": 1})
+        update_issue = AsyncMock(return_value={"iid": 2})
+
+        with (
+            patch("gitlab_mcp.tools.get_project", new=get_project),
+            patch("gitlab_mcp.tools.update_issue", new=update_issue),
+        ):
+            handlers = await _capture_async_main_handlers()
+            call_tool = handlers["call_tool"]
+            await call_tool("get_project", {"project_id": "group/project"})
+            await call_tool("get_project", {"project_id": "group/project"})
+            assert get_project.await_count == 1
+
+            await call_tool("update_issue", {"project_id": "group/project", "issue_iid": 2})
+            await call_tool("get_project", {"project_id": "group/project"})
+            assert get_project.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_call_tool_shares_concurrent_identical_calls(self) -> None:
+        """Test that identical read-only calls in flight together query GitLab once."""
+        calls = 0
+
+        async def slow_get_project(client: Any, project_id: str) -> dict[str, str]:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"id": project_id}
+
+        with patch("gitlab_mcp.tools.get_project", new=slow_get_project):
+            handlers = await _capture_async_main_handlers()
+            call_tool = handlers["call_tool"]
+            results = await asyncio.gather(
+                call_tool("get_project", {"project_id": "a"}),
+                call_tool("get_project", {"project_id": "a"}),
+                call_tool("get_project", {"project_id": "b"}),
+            )
+
+        assert calls == 2
+        assert [json.loads(r[0].text)["id"] for r in results] == ["a", "a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_call_tool_mutation_clears_results_for_any_project_form(self) -> None:
+        """Test that a write by numeric project ID drops reads keyed by path and listings."""
+        get_project = AsyncMock(return_value={"id": 123})
+        list_projects = AsyncMock(return_value=[{"id": 123}])
+        update_issue = AsyncMock(side_effect=RuntimeError("timeout"))
+
+        with (
+            patch("gitlab_mcp.tools.get_project", new=get_project),
+            patch("gitlab_mcp.tools.list_projects", new=list_projects),
+            patch("gitlab_mcp.tools.update_issue", new=update_issue),
+        ):
+            handlers = await _capture_async_main_handlers()
+            call_tool = handlers["call_tool"]
+            await call_tool("get_project", {"project_id": "group/project"})
+            await call_tool("list_projects", {})
+
+            # Even a failed write may have been applied, so it invalidates too
+            await call_tool("update_issue", {"project_id": "123", "issue_iid": 2})
+            await call_tool("get_project", {"project_id": "group/project"})
+            await call_tool("list_projects", {})
+
+        assert get_project.await_count == 2
+        assert list_projects.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_call_tool_does_not_cache_reads_that_overlap_a_mutation(self) -> None:
+        """Test that a read running while a mutation completes is neither shared nor cached."""
+        import threading
+
+        issue = {"title": "old"}
+        started = threading.Event()
+        release = threading.Event()
+
+        async def slow_get_issue(client: Any, project_id: str, issue_iid: int) -> dict[str, str]:
+            snapshot = dict(issue)
+            started.set()
+            release.wait(5)
+            return snapshot
+
+        async def fake_update_issue(client: Any, project_id: str, issue_iid: int) -> dict[str, int]:
+            issue["title"] = "new"
+            return {"iid": issue_iid}
+
+        arguments = {"project_id": "group/project", "issue_iid": 1}
+        with (
+            patch("gitlab_mcp.tools.get_issue", new=slow_get_issue),
+            patch("gitlab_mcp.tools.update_issue", new=fake_update_issue),
+        ):
+            handlers = await _capture_async_main_handlers()
+            call_tool = handlers["call_tool"]
+            stale_read = asyncio.ensure_future(call_tool("get_issue", arguments))
+            await asyncio.to_thread(started.wait, 5)
+            await call_tool("update_issue", arguments)
+            # Issued after the write, so it must not join the read still in flight
+            joined_read = asyncio.ensure_future(call_tool("get_issue", arguments))
+            await asyncio.sleep(0)
+            release.set()
+            await stale_read
+            after_write = await joined_read
+            fresh = await call_tool("get_issue", arguments)
+
+        assert json.loads(after_write[0].text) == {"title": "new"}
+        assert json.loads(fresh[0].text) == {"title": "new"}
+
+    @pytest.mark.asyncio
+    async def test_call_tool_cancelled_mutation_invalidates_when_write_finishes(self) -> None:
+        """Test that cancelling a write does not clear the cache before the worker finishes."""
+        import threading
+
+        issue = {"title": "old"}
+        started = threading.Event()
+        release = threading.Event()
+        written = threading.Event()
+
+        async def get_issue(client: Any, project_id: str, issue_iid: int) -> dict[str, str]:
+            return dict(issue)
+
+        async def slow_update_issue(client: Any, project_id: str, issue_iid: int) -> dict[str, int]:
+            started.set()
+            release.wait(5)
+            issue["title"] = "new"
+            written.set()
+            return {"iid": issue_iid}
+
+        arguments = {"project_id": "group/project", "issue_iid": 1}
+        with (
+            patch("gitlab_mcp.tools.get_issue", new=get_issue),
+            patch("gitlab_mcp.tools.update_issue", new=slow_update_issue),
+        ):
+            handlers = await _capture_async_main_handlers()
+            call_tool = handlers["call_tool"]
+            write = asyncio.ensure_future(call_tool("update_issue", arguments))
+            await asyncio.to_thread(started.wait, 5)
+            write.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await write
+
+            # The worker is still writing, so this read sees the old title
+            during_write = await call_tool("get_issue", arguments)
+            release.set()
+            await asyncio.to_thread(written.wait, 5)
+            await asyncio.sleep(0.05)
+            after_write = await call_tool("get_issue", arguments)
+
+        assert json.loads(during_write[0].text) == {"title": "old"}
+        assert json.loads(after_write[0].text) == {"title": "new"}
+
+    @pytest.mark.asyncio
+    async def test_call_tool_does_not_cache_pipeline_status(self) -> None:
+        """Test that polled pipeline status tools always reach GitLab."""
+        get_pipeline = AsyncMock(return_value={"status": "running"})
+
+        with patch("gitlab_mcp.tools.get_pipeline", new=get_pipeline):
+            handlers = await _capture_async_main_handlers()
+            for _ in range(2):
+                await handlers["call_tool"]("get_pipeline", {"project_id": "p", "pipeline_id": 1})
+
+        assert get_pipeline.await_count == 2
+
+    @pytest.mark.parametrize(
+        "tool_name",
+        [
+            "get_pipeline",
+            "get_job",
+            "get_merge_request",
+            "get_merge_request_pipelines",
+        ],
+    )
+    def test_polled_status_tools_are_not_cacheable(self, tool_name: str) -> None:
+        """Test that tools clients poll for pipeline or merge status skip the cache."""
+        assert tool_name not in _CACHEABLE_TOOLS
+
+    @pytest.mark.asyncio
+    async def test_call_tool_logs_argument_errors_without_traceback(self) -> None:
+        """Test that only argument-binding errors are logged without a traceback."""
+
+        async def get_project_without_params(client: Any) -> dict[str, int]:
+            return {"id": 1}
+
+        get_user = AsyncMock(side_effect=ValueError("bad response from GitLab"))
+        get_group = AsyncMock(return_value={"created": object()})
+
+        with (
+            patch("gitlab_mcp.tools.get_project", new=get_project_without_params),
+            patch("gitlab_mcp.tools.get_user", new=get_user),
+            patch("gitlab_mcp.tools.get_group", new=get_group),
+            patch("gitlab_mcp.server.logger") as mock_logger,
+        ):
+            handlers = await _capture_async_main_handlers()
+            bad_args = await handlers["call_tool"]("get_project", {"project_id": "p"})
+            tool_error = await handlers["call_tool"]("get_user", {"user_id": 1})
+            encode_error = await handlers["call_tool"]("get_group", {"group_id": "g"})
+
+        assert bad_args[0].text == "Error executing get_project: operation failed"
+        assert tool_error[0].text == "Error executing get_user: operation failed"
+        assert encode_error[0].text == "Error executing get_group: operation failed"
+        rejected = [
+            call
+            for call in mock_logger.info.call_args_list
+            if call.args[0].startswith("Tool '%s' rejected")
+        ]
+        assert [call.args[1] for call in rejected] == ["get_project"]
+        assert "exc_info" not in rejected[0].kwargs
+        # Errors raised inside tool code or while encoding the result keep the traceback
+        assert mock_logger.error.call_count == 2
+        assert all(call.kwargs["exc_info"] is True for call in mock_logger.error.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_call_tool_rejects_invalid_arguments(self) -> None:
+        """Test that arguments are validated against the tool schema before dispatch."""
+        get_project = AsyncMock(return_value={"id": 1})
+
+        with patch("gitlab_mcp.tools.get_project", new=get_project):
+            handlers = await _capture_async_main_handlers()
+            with pytest.raises(ValueError, match="Input validation error: 'project_id'"):
+                await handlers["call_tool"]("get_project", {})
+
+        get_project.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_call_tool_rejects_unadvertised_name(self) -> None:
+        """Test that module attributes which are not advertised tools cannot be called."""
+        handlers = await _capture_async_main_handlers()
+
+        with pytest.raises(ValueError, match="Unknown tool: discover_tools"):
+            await handlers["call_tool"]("discover_tools", {})
+
+    @pytest.mark.asyncio
+    async def test_call_tool_slim_mode_only_exposes_meta_tools(self) -> None:
+        """Test that slim mode dispatches only the meta-tools."""
+        handlers = await _capture_async_main_handlers(mode="slim")
+
+        with pytest.raises(ValueError, match="Unknown tool: get_project"):
+            await handlers["call_tool"]("get_project", {"project_id": "group/project"})
+
+    @pytest.mark.asyncio
+    async def test_call_tool_slim_mode_caches_like_the_executed_tool(self) -> None:
+        """Test that execute_tool calls are cached and invalidated like the tool they run."""
+        get_project = AsyncMock(return_value={"id": 1})
+        update_issue = AsyncMock(return_value={"iid": 2})
+        read = {"tool_name": "get_project", "arguments": {"project_id": "group/project"}}
+        write = {
+            "tool_name": "update_issue",
+            "arguments": {"project_id": "group/project", "issue_iid": 2},
+        }
+
+        with (
+            patch("gitlab_mcp.tools.get_project", new=get_project),
+            patch("gitlab_mcp.tools.update_issue", new=update_issue),
+        ):
+            handlers = await _capture_async_main_handlers(mode="slim")
+            call_tool = handlers["call_tool"]
+            await call_tool("execute_tool", read)
+            await call_tool("discover_tools", {"category": "projects"})
+            await call_tool("get_tool_schema", {"tool_name": "get_project"})
+            await call_tool("execute_tool", read)
+            assert get_project.await_count == 1
+
+            await call_tool("execute_tool", write)
+            await call_tool("execute_tool", read)
+            assert get_project.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_call_tool_slim_mode_does_not_cache_failed_reads(self) -> None:
+        """Test that an error reported by execute_tool is not served from the cache."""
+        get_project = AsyncMock(side_effect=[RuntimeError("timeout"), {"id": 1}])
+        read = {"tool_name": "get_project", "arguments": {"project_id": "group/project"}}
+
+        with patch("gitlab_mcp.tools.get_project", new=get_project):
+            handlers = await _capture_async_main_handlers(mode="slim")
+            call_tool = handlers["call_tool"]
+            failed = await call_tool("execute_tool", read)
+            retried = await call_tool("execute_tool", read)
+
+        assert "error" in json.loads(failed[0].text)
+        assert json.loads(retried[0].text) == {"id": 1}
+
+
 class TestBuildToolSchema:
     """Test _build_tool_schema helper function."""
 
@@ -514,6 +1117,35 @@ class TestBuildToolSchema:
         assert result["required"] == ["id"]
 
 
+class TestBuildPromptsList:
+    """Test _build_prompts_list and _build_prompt_arguments helpers."""
+
+    def test_no_arguments_returns_none(self) -> None:
+        """Test that prompts without arguments get None rather than an empty list."""
+        assert _build_prompt_arguments(None) is None
+        assert _build_prompt_arguments([]) is None
+
+    def test_arguments_are_converted(self) -> None:
+        """Test that argument dicts become PromptArgument objects."""
+        arguments = _build_prompt_arguments(
+            [{"name": "project_id", "description": "Project", "required": True}, {"name": "ref"}]
+        )
+
+        assert arguments is not None
+        assert [arg.name for arg in arguments] == ["project_id", "ref"]
+        assert arguments[0].required is True
+        assert arguments[1].required is False
+
+    def test_builds_prompts_from_registry(self) -> None:
+        """Test that every registry prompt is converted to an MCP Prompt."""
+        from gitlab_mcp.prompts.registry import PromptRegistry
+
+        registry = PromptRegistry()
+        prompts = _build_prompts_list(registry)
+
+        assert [p.name for p in prompts] == [d["name"] for d in registry.list_prompts()]
+
+
 class TestSchemaDescriptionConstants:
     """Test schema description constants for SonarQube S1192 compliance."""
 
@@ -317,6 +317,18 @@ class TestGetToolAnnotationsFunction:
         annotation = get_tool_annotations("delete_branch")
         assert annotation == {"destructive": True, "readOnly": False}
 
+    def test_get_tool_annotations_cannot_be_modified(self):
+        """Shared annotations should reject writes so one caller cannot change a group."""
+        with pytest.raises(TypeError):
+            get_tool_annotations("unknown_tool_xyz")["readOnly"] = True  # type: ignore[index]
+
+        assert get_tool_annotations("create_issue")["readOnly"] is False
+
+    def test_get_tool_annotations_discovery_meta_tools_are_readonly(self):
+        """Slim-mode discovery tools only read the tool catalog."""
+        for tool_name in ("discover_tools", "get_tool_schema"):
+            assert get_tool_annotations(tool_name) == {"destructive": False, "readOnly": True}
+
 
 class TestAnnotationConsistency:
     """Test logical consistency of annotations."""
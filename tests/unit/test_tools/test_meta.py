@@ -0,0 +1,76 @@
+"""Unit tests for slim-mode meta-tools.
+
+Tests for discover_tools, get_tool_schema and execute_tool lookups.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from gitlab_mcp.client.gitlab_client import GitLabClient
+from gitlab_mcp.server import _get_tool_definitions
+from gitlab_mcp.tools.meta import (
+    _TOOL_CATEGORY_INDEX,
+    TOOL_CATEGORIES,
+    _get_all_tool_names,
+    _get_tool_definitions_map,
+    discover_tools,
+    execute_tool,
+    get_tool_schema,
+)
+
+
+@pytest.fixture
+def mock_client() -> Mock:
+    """Create a mock GitLab client."""
+    return Mock(spec=GitLabClient)
+
+
+class TestToolIndexes:
+    """Tests for the precomputed tool lookups."""
+
+    def test_category_index_covers_every_category_tool(self) -> None:
+        """Every categorized tool should map back to its category."""
+        for cat_name, cat_info in TOOL_CATEGORIES.items():
+            for tool_name in cat_info["tools"]:
+                assert _TOOL_CATEGORY_INDEX[tool_name] == cat_name
+
+    def test_all_tool_names_keep_category_order(self) -> None:
+        """All tool names should be listed category by category."""
+        expected = [name for cat in TOOL_CATEGORIES.values() for name in cat["tools"]]
+        assert _get_all_tool_names() == expected
+
+    def test_tool_definitions_map_is_built_once(self) -> None:
+        """The definitions map should be cached and cover every server tool."""
+        assert _get_tool_definitions_map() is _get_tool_definitions_map()
+        assert set(_get_tool_definitions_map()) == {name for name, _, _ in _get_tool_definitions()}
+
+
+class TestMetaTools:
+    """Tests for the meta-tool functions."""
+
+    @pytest.mark.asyncio
+    async def test_discover_tools_by_category(self, mock_client: Mock) -> None:
+        """discover_tools should list a category's tools with descriptions."""
+        result = await discover_tools(mock_client, category="labels")
+
+        assert result["category"] == "labels"
+        assert [t["name"] for t in result["tools"]] == TOOL_CATEGORIES["labels"]["tools"]
+        assert all(t["description"] != "No description" for t in result["tools"])
+
+    @pytest.mark.asyncio
+    async def test_get_tool_schema_reports_category(self, mock_client: Mock) -> None:
+        """get_tool_schema should return the schema and the tool's category."""
+        result = await get_tool_schema(mock_client, "get_job_trace")
+
+        assert result["category"] == "pipelines"
+        assert result["inputSchema"]["required"] == ["project_id", "job_id"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool_names_are_rejected(self, mock_client: Mock) -> None:
+        """Unknown tools should produce an error instead of a lookup."""
+        schema = await get_tool_schema(mock_client, "not_a_tool")
+        executed = await execute_tool(mock_client, "not_a_tool", {})
+
+        assert schema["error"] == "Unknown tool: not_a_tool"
+        assert executed["error"] == "Unknown tool: not_a_tool"
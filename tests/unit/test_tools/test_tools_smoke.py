@@ -7,7 +7,11 @@ These tests verify that:
 3. Server can register and list all tools
 """
 
+import ast
 import inspect
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
@@ -20,6 +24,44 @@ from gitlab_mcp.server import GitLabMCPServer
 class TestToolsImports:
     """Test that all tools can be imported."""
 
+    def test_all_exports_resolve(self):
+        """Test that every name in __all__ resolves through lazy loading."""
+        for name in tools.__all__:
+            assert getattr(tools, name) is not None, f"{name} should resolve"
+
+    def test_type_checking_imports_match_lazy_exports(self):
+        """Test that the TYPE_CHECKING imports list exactly the lazily exported names."""
+        tree = ast.parse(Path(tools.__file__).read_text())
+        type_checking_block = next(
+            node
+            for node in tree.body
+            if isinstance(node, ast.If) and ast.unparse(node.test) == "TYPE_CHECKING"
+        )
+        imported = {
+            (node.module.rsplit(".", 1)[-1], alias.name)
+            for node in type_checking_block.body
+            if isinstance(node, ast.ImportFrom) and node.module
+            for alias in node.names
+        }
+
+        assert imported == {(module, name) for name, module in tools._TOOL_MODULES.items()}
+
+    def test_submodules_imported_lazily(self):
+        """Test that importing the package does not import every tool module."""
+        code = (
+            "import sys, gitlab_mcp.tools as t; "
+            "assert 'gitlab_mcp.tools.labels' not in sys.modules; "
+            "t.list_labels; "
+            "assert 'gitlab_mcp.tools.labels' in sys.modules; "
+            "assert 'gitlab_mcp.tools.wikis' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_unknown_attribute_raises(self):
+        """Test that unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            tools.not_a_tool  # noqa: B018
+
     def test_context_tools_import(self):
         """Test context tools can be imported."""
         assert hasattr(tools, "get_current_context")
@@ -216,16 +258,23 @@ class TestServerToolRegistration:
         server.register_all_tools()
 
         for tool_name, tool_info in server._tools.items():
-            assert "description" in tool_info
-            assert tool_info["description"], f"{tool_name} should have non-empty description"
+            assert tool_info.description, f"{tool_name} should have non-empty description"
 
     def test_all_registered_tools_have_functions(self, server):
         """Test that all registered tools have callable functions."""
         server.register_all_tools()
 
         for tool_name, tool_info in server._tools.items():
-            assert "function" in tool_info
-            assert callable(tool_info["function"]), f"{tool_name} function should be callable"
+            assert callable(tool_info.function), f"{tool_name} function should be callable"
+
+    def test_registered_functions_bind_client(self, server):
+        """Test that registered functions are tool functions bound to the server's client."""
+        server.register_all_tools()
+
+        for tool_name, tool_info in server._tools.items():
+            function = tool_info.function
+            assert function.func is getattr(tools, tool_name)
+            assert function.args == (server.gitlab_client,)
 
     def test_tool_categories_registered(self, server):
         """Test that tools from all categories are registered."""
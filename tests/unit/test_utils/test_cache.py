@@ -0,0 +1,148 @@
+"""Unit tests for the tool result cache.
+
+Tests verify:
+- Cached results are returned until their TTL expires
+- Least recently used entries are evicted when the cache is full
+- Keys follow parameter order, freeze list values and reject unknown arguments
+- Mutating calls invalidate every cached result
+"""
+
+from unittest.mock import Mock
+
+from gitlab_mcp.utils.cache import ToolResultCache
+
+PROJECT_PARAMS = ("project_id",)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestToolResultCacheLookup:
+    """Test storing and retrieving cached results."""
+
+    def test_miss_on_empty_cache(self):
+        """An empty cache should report a miss."""
+        cache = ToolResultCache()
+        key = cache.make_key("get_project", PROJECT_PARAMS, {"project_id": "1"})
+        assert cache.get(key) == (False, None)
+
+    def test_hit_after_set(self):
+        """A stored result should be returned for the same name and arguments."""
+        cache = ToolResultCache()
+        key = cache.make_key("get_project", PROJECT_PARAMS, {"project_id": "1"})
+        cache.set(key, {"id": 1})
+
+        assert cache.get(cache.make_key("get_project", PROJECT_PARAMS, {"project_id": "1"})) == (
+            True,
+            {"id": 1},
+        )
+
+    def test_key_includes_tool_name(self):
+        """Different tools with the same arguments should not share entries."""
+        cache = ToolResultCache()
+        arguments = {"project_id": "1"}
+        cache.set(cache.make_key("get_project", PROJECT_PARAMS, arguments), {"id": 1})
+
+        assert cache.get(cache.make_key("list_labels", PROJECT_PARAMS, arguments)) == (False, None)
+
+    def test_key_ignores_argument_order(self):
+        """Keys should follow parameter order, not the order arguments were passed."""
+        params = ("project_id", "state")
+        assert ToolResultCache.make_key(
+            "list_issues", params, {"project_id": "1", "state": "opened"}
+        ) == ToolResultCache.make_key("list_issues", params, {"state": "opened", "project_id": "1"})
+
+    def test_omitted_argument_differs_from_none(self):
+        """An omitted parameter should not share a key with an explicit None."""
+        params = ("project_id", "state")
+        assert ToolResultCache.make_key(
+            "list_issues", params, {"project_id": "1"}
+        ) != ToolResultCache.make_key("list_issues", params, {"project_id": "1", "state": None})
+
+    def test_list_arguments_are_frozen(self):
+        """List values should be keyed as tuples, keeping their order."""
+        params = ("project_id", "labels")
+        key = ToolResultCache.make_key("list_issues", params, {"labels": ["bug", "ui"]})
+        assert key is not None
+        assert key == ToolResultCache.make_key("list_issues", params, {"labels": ["bug", "ui"]})
+        assert key != ToolResultCache.make_key("list_issues", params, {"labels": ["ui", "bug"]})
+
+    def test_unknown_arguments_have_no_key(self):
+        """Arguments outside the tool's parameters cannot be cached."""
+        assert ToolResultCache.make_key("get_project", PROJECT_PARAMS, {"extra": 1}) is None
+
+    def test_unhashable_arguments_have_no_key(self):
+        """Arguments with nested unhashable values cannot be cached."""
+        key = ToolResultCache.make_key("list_issues", ("labels",), {"labels": [["bug"]]})
+        assert key is None
+
+
+class TestToolResultCacheExpiry:
+    """Test TTL expiry and LRU eviction."""
+
+    def test_entry_expires_after_ttl(self):
+        """Results should not be served once their TTL has passed."""
+        clock = FakeClock()
+        cache = ToolResultCache(ttl_seconds=30, clock=clock)
+        key = cache.make_key("get_project", PROJECT_PARAMS, {"project_id": "1"})
+        cache.set(key, {"id": 1})
+
+        clock.now = 29.9
+        assert cache.get(key)[0] is True
+        clock.now = 30.0
+        assert cache.get(key) == (False, None)
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """The least recently used entry should be evicted when full."""
+        cache = ToolResultCache(max_entries=2)
+        keys = [
+            cache.make_key("get_project", PROJECT_PARAMS, {"project_id": str(i)}) for i in range(3)
+        ]
+        cache.set(keys[0], 0)
+        cache.set(keys[1], 1)
+        cache.get(keys[0])  # Touch entry 0 so entry 1 becomes least recently used
+        cache.set(keys[2], 2)
+
+        assert cache.get(keys[0]) == (True, 0)
+        assert cache.get(keys[1]) == (False, None)
+        assert cache.get(keys[2]) == (True, 2)
+
+
+class TestToolResultCacheInvalidation:
+    """Test invalidation after mutating tool calls."""
+
+    def test_invalidate_clears_every_project(self):
+        """Invalidation should drop all results, global listings and in-flight calls."""
+        cache = ToolResultCache()
+        key_path = cache.make_key("get_project", PROJECT_PARAMS, {"project_id": "group/proj"})
+        key_listing = cache.make_key("list_projects", (), {})
+        cache.set(key_path, {"id": 123})
+        cache.set(key_listing, [{"id": 123}])
+
+        cache.inflight[key_path] = Mock()
+
+        cache.invalidate()
+
+        assert len(cache) == 0
+        assert cache.inflight == {}
+
+    def test_results_started_before_invalidation_are_not_stored(self):
+        """A result whose call overlapped an invalidation should be dropped."""
+        cache = ToolResultCache()
+        key = cache.make_key("get_project", PROJECT_PARAMS, {"project_id": "a"})
+        started_at = cache.generation
+
+        cache.invalidate()
+        cache.set(key, {"title": "old"}, started_at)
+
+        assert cache.get(key) == (False, None)
+        cache.set(key, {"title": "new"}, cache.generation)
+        assert cache.get(key) == (True, {"title": "new"})